@@ -192,7 +192,7 @@ async def analyze_market(
     """Analyze market using technical indicators and AI."""
     try:
         # Get market data from OANDA
-        oanda_url = "https://api-fxpractice.oanda.com" if settings.broker.environment == "practice" else "https://api-fxtrade.oanda.com"
+        oanda_url = settings.broker.api_url
         oanda_headers = {
             "Authorization": f"Bearer 1725da5aa30805b09b7c7eb0094ffff4-d6b1be348877531faa9a3253cbda3cfd",
             "Content-Type": "application/json"
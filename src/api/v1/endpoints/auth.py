@@ -2,7 +2,7 @@
 Authentication endpoints for user management and security.
 """
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
@@ -92,7 +92,7 @@ async def register(user: UserCreate):
         # For now, always allow registration
         
         # Hash password
-        hashed_password = security_manager.hash_password(user.password)
+        hashed_password = await security_manager.hash_password(user.password)
         
         # Create user (this would save to database)
         # For now, just return success
@@ -155,12 +155,12 @@ async def generate_master_password(current_user: str = Depends(get_current_user)
             )
         
         # Generate master password
-        master_password = security_manager.generate_master_password()
+        master_password = await security_manager.generate_master_password()
         
         return {
             "message": "Master password generated successfully",
             "master_password": master_password,
-            "expires_at": security_manager.master_password.expires_at.isoformat() if security_manager.master_password else None
+            "expires_at": datetime.fromtimestamp(security_manager.master_password.expires_at, timezone.utc).isoformat() if security_manager.master_password else None
         }
         
     except HTTPException:
@@ -203,7 +203,7 @@ async def generate_emergency_token(current_user: str = Depends(get_current_user)
             )
         
         # Generate emergency token
-        emergency_token = security_manager.generate_emergency_token()
+        emergency_token = await security_manager.generate_emergency_token()
         
         return {
             "message": "Emergency token generated successfully",
@@ -225,7 +225,7 @@ async def verify_emergency_token(token: str):
     """Verify emergency access token."""
     try:
         # Verify emergency token
-        is_valid = security_manager.verify_emergency_token(token)
+        is_valid = await security_manager.verify_emergency_token(token)
         
         if is_valid:
             return {"message": "Emergency token verified successfully", "valid": True}
@@ -20,7 +20,7 @@ from src.services.eia_service import eia_service
 router = APIRouter()
 
 # OANDA API configuration
-OANDA_BASE_URL = "https://api-fxpractice.oanda.com" if settings.broker.environment == "practice" else "https://api-fxtrade.oanda.com"
+OANDA_BASE_URL = settings.broker.api_url
 OANDA_HEADERS = {
     "Authorization": f"Bearer 1725da5aa30805b09b7c7eb0094ffff4-d6b1be348877531faa9a3253cbda3cfd",
     "Content-Type": "application/json"
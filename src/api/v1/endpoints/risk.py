@@ -96,7 +96,7 @@ async def get_risk_metrics(
         # Real risk metrics calculated from actual positions and trades
         try:
             # Get current positions from OANDA
-            oanda_url = "https://api-fxpractice.oanda.com" if settings.broker.environment == "practice" else "https://api-fxtrade.oanda.com"
+            oanda_url = settings.broker.api_url
             oanda_headers = {
                 "Authorization": f"Bearer 1725da5aa30805b09b7c7eb0094ffff4-d6b1be348877531faa9a3253cbda3cfd",
                 "Content-Type": "application/json"
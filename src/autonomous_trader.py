@@ -6,20 +6,41 @@ Runs continuously and executes trades automatically based on AI analysis.
 
 import asyncio
 import json
+import os
 import time
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
+import numpy as np
+import orjson
 import requests
 import structlog
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from src.oanda_client import OANDAClient
+from src.trader_fastpath import side_sign, trade_pnl, check_exit
 
 # Configure logging
 logger = structlog.get_logger()
 
-@dataclass
+MAX_TRADE_DURATION = timedelta(hours=4)
+
+# Per-tick debug logging is skipped entirely unless explicitly enabled
+_PRICE_LOG_DEBUG = os.environ.get("TRADER_PRICE_LOG_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Shared fallback for ticks missing a side of the book (avoids a new list per tick)
+_EMPTY_BOOK = ({},)
+
+# Log message per streamed transaction type
+_TRANSACTION_MESSAGES = {
+    "ORDER_FILL": "New trade filled via streaming",
+    "TRADE_CLOSE": "Trade closed via streaming",
+    "STOP_LOSS_FILLED": "Stop loss triggered",
+    "TAKE_PROFIT_FILLED": "Take profit triggered",
+}
+
+@dataclass(slots=True)
 class TradeSignal:
     """Trade signal from AI analysis."""
     pair: str
@@ -32,7 +53,7 @@ class TradeSignal:
     reasoning: str
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True)
 class ActiveTrade:
     """Currently active trade."""
     trade_id: str
@@ -50,12 +71,20 @@ class ActiveTrade:
     status: str = "OPEN"
 
 class AutonomousTrader:
-    """Autonomous algorithmic trading system."""
+    """Autonomous algorithmic trading system.
+    
+    Expects to run on uvloop in production (installed by the ``__main__``
+    entry point when available); falls back to the stdlib event loop.
+    """
     
     def __init__(self):
         self.api_base = "http://localhost:8000"
         self.active_trades: Dict[str, ActiveTrade] = {}
+        self._trades_by_instrument: Dict[str, List[ActiveTrade]] = {}  # pair -> active trades
         self.trade_history: List[Dict] = []
+        self._history_index: Dict[str, Dict] = {}  # open trade_id -> history record
+        self.history_path = 'trade_history.jsonl'
+        self._hist_fp = None  # Append-only journal of closed trades
         self.is_running = False
         self.trading_enabled = True
         
@@ -77,15 +106,40 @@ class AutonomousTrader:
         self.max_drawdown = 0.15  # 15% maximum drawdown
         self.trailing_stop_distance = 50  # 50 pips trailing stop
         self.use_trailing_stops = True  # Enable trailing stops
+        self.trailing_stop_flush_interval = 0.2  # Seconds between batched stop updates
+        self._pending_stops: Dict[str, float] = {}  # trade_id -> latest trailing stop
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Latest pricing tick per instrument, drained by the tick worker
+        self._latest_tick: Dict[str, Dict] = {}
+        self._tick_event = asyncio.Event()
+        self._tick_task: Optional[asyncio.Task] = None
         
         # Performance Tracking
         self.performance_metrics = {}
         self.correlation_matrix = {}
+        self._corr = np.empty((0, 0), dtype=np.float32)  # Dense copy of correlation_matrix
+        self._pair_idx: Dict[str, int] = {}
         self.streaming_enabled = True
         
+        # Running counters so status logging stays O(1) per cycle
+        self._closed_count = 0
+        self._winning_count = 0
+        self._total_pnl = 0.0
+        self._total_risk = 0.0
+        
+        # Order submission: one worker task drains the queue and talks to OANDA
+        self._order_queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self._order_worker: Optional[asyncio.Task] = None
+        self.max_orders_in_flight = 4
+        self.io_workers = 8  # Threads for blocking OANDA REST calls
+        
         # Trading pairs to monitor (OANDA format)
         self.trading_pairs = ["EUR_USD", "GBP_USD", "USD_JPY"]
         
+        # Price increment of one pip per pair (JPY crosses quote to 2 decimals)
+        self._pip_size = {"EUR_USD": 0.0001, "GBP_USD": 0.0001, "USD_JPY": 0.01}
+        
         # Strategy weights
         self.strategy_weights = {
             "trend_following": 0.4,
@@ -107,7 +161,21 @@ class AutonomousTrader:
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
+        # Blocking OANDA REST calls run on the default executor
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.io_workers)
+        )
+        
         try:
+            # Open the closed-trade journal
+            try:
+                self._hist_fp = open(self.history_path, 'ab', buffering=0)
+            except OSError as e:
+                logger.error("Failed to open trade history journal", error=str(e))
+            
+            # Start the order submission worker
+            self._start_order_worker()
+            
             # Initialize account balance
             await self.update_account_balance()
             
@@ -156,7 +224,7 @@ class AutonomousTrader:
         """Update account balance information."""
         try:
             # Use OANDA client for direct account access
-            account_summary = self.oanda_client.get_account_summary()
+            account_summary = await asyncio.to_thread(self.oanda_client.get_account_summary)
             if account_summary:
                 self.account_balance = float(account_summary.get('balance', 100000))
                 logger.info("Account balance updated", balance=self.account_balance)
@@ -173,8 +241,10 @@ class AutonomousTrader:
     async def monitor_active_trades(self):
         """Monitor and manage active trades."""
         trades_to_close = []
+        _now, _utc, _limit = datetime.now, timezone.utc, MAX_TRADE_DURATION
+        _side_sign, _trade_pnl, _check_exit = side_sign, trade_pnl, check_exit
         
-        for trade_id, trade in self.active_trades.items():
+        for trade_id, trade in list(self.active_trades.items()):
             try:
                 # Get current market price
                 current_price = await self.get_current_price(trade.pair)
@@ -184,37 +254,17 @@ class AutonomousTrader:
                 trade.current_price = current_price
                 
                 # Calculate P&L
-                if trade.side == "BUY":
-                    trade.pnl = (current_price - trade.entry_price) * trade.lot_size * 100000
-                else:
-                    trade.pnl = (trade.entry_price - current_price) * trade.lot_size * 100000
-                
-                # Check exit conditions
-                should_exit = False
-                exit_reason = ""
-                
-                # Stop loss check
-                if trade.side == "BUY" and current_price <= trade.stop_loss:
-                    should_exit = True
-                    exit_reason = "Stop Loss"
-                elif trade.side == "SELL" and current_price >= trade.stop_loss:
-                    should_exit = True
-                    exit_reason = "Stop Loss"
+                sign = _side_sign(trade.side)
+                pnl = _trade_pnl(sign, trade.entry_price, current_price, trade.lot_size)
+                self._total_pnl += pnl - trade.pnl
+                trade.pnl = pnl
                 
-                # Take profit check
-                elif trade.side == "BUY" and current_price >= trade.take_profit:
-                    should_exit = True
-                    exit_reason = "Take Profit"
-                elif trade.side == "SELL" and current_price <= trade.take_profit:
-                    should_exit = True
-                    exit_reason = "Take Profit"
-                
-                # Time-based exit (4 hours max)
-                elif datetime.now(timezone.utc) - trade.entry_time > timedelta(hours=4):
-                    should_exit = True
+                # Check stop loss / take profit, then time-based exit (4 hours max)
+                exit_reason = _check_exit(sign, current_price, trade.stop_loss, trade.take_profit)
+                if not exit_reason and _now(_utc) - trade.entry_time > _limit:
                     exit_reason = "Time Limit"
                 
-                if should_exit:
+                if exit_reason:
                     trades_to_close.append((trade_id, exit_reason))
                 
                 logger.info("Trade monitored", 
@@ -264,16 +314,12 @@ class AutonomousTrader:
             return False
         
         # Check if we're not over-risked
-        total_risk = sum(trade.amount_usd * self.max_risk_per_trade 
-                        for trade in self.active_trades.values())
-        if total_risk >= self.account_balance * self.total_account_risk:
+        if self._total_risk >= self.account_balance * self.total_account_risk:
             return False
         
         # Check if we don't have too many trades on this pair
         pair = analysis.get('pair', '')
-        pair_trades = sum(1 for trade in self.active_trades.values() 
-                         if trade.pair == pair)
-        if pair_trades >= 1:  # Max 1 trade per pair
+        if len(self._trades_by_instrument.get(pair, ())) >= 1:  # Max 1 trade per pair
             return False
         
         # Check correlation risk
@@ -288,9 +334,14 @@ class AutonomousTrader:
     async def execute_trade(self, pair: str, analysis: Dict, strategy: Dict):
         """Execute a new trade."""
         try:
+            # Read strategy parameters once
+            strategy_params = strategy['strategy']
+            stop_loss_pips = strategy_params['stop_loss_pips']
+            take_profit_pips = strategy_params['take_profit_pips']
+            strategy_name = strategy_params['name']
+            
             # Calculate position size
             risk_amount = self.account_balance * self.max_risk_per_trade
-            stop_loss_pips = strategy['strategy']['stop_loss_pips']
             
             # Calculate lot size (convert to units for OANDA)
             pip_value = 10  # For 100k lot
@@ -312,17 +363,14 @@ class AutonomousTrader:
             
             # Calculate stop loss and take profit
             side = analysis['recommendation']
-            if side == "BUY":
-                stop_loss = current_price - (stop_loss_pips * 0.0001)
-                take_profit = current_price + (strategy['strategy']['take_profit_pips'] * 0.0001)
-                oanda_side = "buy"
-            else:
-                stop_loss = current_price + (stop_loss_pips * 0.0001)
-                take_profit = current_price - (strategy['strategy']['take_profit_pips'] * 0.0001)
-                oanda_side = "sell"
+            pip = self._pip_size.get(pair, 0.0001)
+            sign = 1 if side == "BUY" else -1
+            stop_loss = current_price - sign * stop_loss_pips * pip
+            take_profit = current_price + sign * take_profit_pips * pip
+            oanda_side = "buy" if sign > 0 else "sell"
             
             # Execute real trade via OANDA
-            order_result = self.oanda_client.place_market_order(
+            order_result = await self.submit_order(
                 instrument=pair,
                 units=units,
                 side=oanda_side,
@@ -345,12 +393,14 @@ class AutonomousTrader:
                     take_profit=take_profit,
                     lot_size=round(lot_size, 2),
                     amount_usd=risk_amount / self.max_risk_per_trade,
-                    strategy=strategy['strategy']['name'],
+                    strategy=strategy_name,
                     entry_time=datetime.now(timezone.utc)
                 )
                 
                 # Add to active trades
                 self.active_trades[trade_id] = trade
+                self._trades_by_instrument.setdefault(pair, []).append(trade)
+                self._total_risk += trade.amount_usd * self.max_risk_per_trade
                 
                 # Log successful trade execution
                 logger.info("Real trade executed via OANDA", 
@@ -360,12 +410,28 @@ class AutonomousTrader:
                            entry_price=trade.entry_price,
                            units=units,
                            lot_size=lot_size,
-                           strategy=strategy['strategy']['name'],
+                           strategy=strategy_name,
                            confidence=analysis.get('confidence', 0),
                            reasoning=analysis.get('reasoning', ''))
                 
                 # Add to trade history
-                self.trade_history.append(asdict(trade))
+                history_record = {
+                    'trade_id': trade_id,
+                    'pair': pair,
+                    'side': side,
+                    'entry_price': trade.entry_price,
+                    'current_price': trade.current_price,
+                    'stop_loss': stop_loss,
+                    'take_profit': take_profit,
+                    'lot_size': trade.lot_size,
+                    'amount_usd': trade.amount_usd,
+                    'strategy': strategy_name,
+                    'entry_time': trade.entry_time.isoformat(),
+                    'pnl': 0.0,
+                    'status': 'OPEN'
+                }
+                self.trade_history.append(history_record)
+                self._history_index[trade_id] = history_record
                 
             else:
                 # Trade execution failed
@@ -377,6 +443,39 @@ class AutonomousTrader:
         except Exception as e:
             logger.error("Error executing trade", pair=pair, error=str(e))
 
+    def _start_order_worker(self):
+        """Start the order submission worker if it is not running."""
+        if self._order_worker is None or self._order_worker.done():
+            self._order_worker = asyncio.create_task(self._order_loop())
+
+    async def submit_order(self, **order) -> Optional[Dict]:
+        """Queue a market order for the submission worker and await its result."""
+        self._start_order_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._order_queue.put((order, future))
+        return await future
+
+    async def _order_loop(self):
+        """Submit queued market orders to OANDA, a few in flight at a time."""
+        while True:
+            batch = [await self._order_queue.get()]
+            while len(batch) < self.max_orders_in_flight and not self._order_queue.empty():
+                batch.append(self._order_queue.get_nowait())
+            
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.oanda_client.place_market_order, **order)
+                  for order, _ in batch),
+                return_exceptions=True
+            )
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                self._order_queue.task_done()
+
     async def close_trade(self, trade_id: str, exit_reason: str):
         """Close an active trade."""
         try:
@@ -390,7 +489,7 @@ class AutonomousTrader:
             else:
                 # This is a real OANDA trade, close it
                 try:
-                    close_result = self.oanda_client.close_trade(trade_id)
+                    close_result = await asyncio.to_thread(self.oanda_client.close_trade, trade_id)
                     if close_result:
                         logger.info("Trade closed via OANDA", 
                                    trade_id=trade_id,
@@ -401,10 +500,12 @@ class AutonomousTrader:
                                   error=str(e))
             
             # Calculate final P&L
-            if trade.side == "BUY":
-                final_pnl = (trade.current_price - trade.entry_price) * trade.lot_size * 100000
-            else:
-                final_pnl = (trade.entry_price - trade.current_price) * trade.lot_size * 100000
+            final_pnl = trade_pnl(side_sign(trade.side), trade.entry_price,
+                                  trade.current_price, trade.lot_size)
+            
+            self._closed_count += 1
+            self._winning_count += int(final_pnl > 0)
+            exit_time = datetime.now(timezone.utc)
             
             # Log trade closure
             logger.info("Trade closed", 
@@ -415,20 +516,26 @@ class AutonomousTrader:
                        exit_price=trade.current_price,
                        pnl=final_pnl,
                        exit_reason=exit_reason,
-                       duration=datetime.now(timezone.utc) - trade.entry_time)
+                       duration=exit_time - trade.entry_time)
             
             # Remove from active trades
             del self.active_trades[trade_id]
+            self._trades_by_instrument[trade.pair].remove(trade)
+            self._total_pnl -= trade.pnl
+            self._total_risk -= trade.amount_usd * self.max_risk_per_trade
             
             # Update trade history
-            for history_trade in self.trade_history:
-                if history_trade['trade_id'] == trade_id:
-                    history_trade['status'] = 'CLOSED'
-                    history_trade['exit_price'] = trade.current_price
-                    history_trade['pnl'] = final_pnl
-                    history_trade['exit_reason'] = exit_reason
-                    history_trade['exit_time'] = datetime.now(timezone.utc).isoformat()
-                    break
+            history_trade = self._history_index.pop(trade_id, None)
+            if history_trade is not None:
+                history_trade.update(
+                    status='CLOSED',
+                    exit_price=trade.current_price,
+                    pnl=final_pnl,
+                    exit_reason=exit_reason,
+                    exit_time=exit_time.isoformat()
+                )
+                if self._hist_fp is not None:
+                    self._hist_fp.write(orjson.dumps(history_trade) + b'\n')
             
         except Exception as e:
             logger.error("Error closing trade", trade_id=trade_id, error=str(e))
@@ -487,7 +594,7 @@ class AutonomousTrader:
         """Get current price for a pair."""
         try:
             # Use OANDA client for direct price access
-            pricing = self.oanda_client.get_pricing([pair])
+            pricing = await asyncio.to_thread(self.oanda_client.get_pricing, [pair])
             if pricing and pricing.get('prices'):
                 return float(pricing['prices'][0]['bids'][0]['price'])
             
@@ -507,23 +614,20 @@ class AutonomousTrader:
 
     async def log_system_status(self):
         """Log current system status."""
-        total_pnl = sum(trade.pnl for trade in self.active_trades.values())
         win_rate = self.calculate_win_rate()
         
         logger.info("System status", 
                    active_trades=len(self.active_trades),
-                   total_pnl=total_pnl,
+                   total_pnl=self._total_pnl,
                    win_rate=win_rate,
                    account_balance=self.account_balance)
 
     def calculate_win_rate(self) -> float:
-        """Calculate win rate from trade history."""
-        closed_trades = [t for t in self.trade_history if t.get('status') == 'CLOSED']
-        if not closed_trades:
+        """Calculate win rate from closed-trade counters."""
+        if not self._closed_count:
             return 0.0
         
-        winning_trades = [t for t in closed_trades if t.get('pnl', 0) > 0]
-        return len(winning_trades) / len(closed_trades) * 100
+        return self._winning_count / self._closed_count * 100
 
     def signal_handler(self, signum, frame):
         """Handle shutdown signals."""
@@ -538,13 +642,23 @@ class AutonomousTrader:
         for trade_id in list(self.active_trades.keys()):
             await self.close_trade(trade_id, "System Shutdown")
         
-        # Save trade history
-        await self.save_trade_history()
+        # Closed trades are already journaled; fall back to a full dump without a journal
+        if self._hist_fp is not None:
+            self._hist_fp.close()
+            self._hist_fp = None
+            logger.info("Trade history journal closed", path=self.history_path)
+        else:
+            await self.save_trade_history()
+        
+        # Stop the order submission worker and streaming workers
+        for task in (self._order_worker, self._tick_task, self._flush_task):
+            if task is not None:
+                task.cancel()
         
         logger.info("Autonomous trading system shutdown complete")
 
     async def save_trade_history(self):
-        """Save trade history to file."""
+        """Save the full trade history to the legacy JSON file."""
         try:
             with open('trade_history.json', 'w') as f:
                 json.dump(self.trade_history, f, indent=2, default=str)
@@ -554,12 +668,11 @@ class AutonomousTrader:
 
     def get_system_stats(self) -> Dict:
         """Get current system statistics."""
-        total_pnl = sum(trade.pnl for trade in self.active_trades.values())
         win_rate = self.calculate_win_rate()
         
         return {
             "active_trades": len(self.active_trades),
-            "total_pnl": total_pnl,
+            "total_pnl": self._total_pnl,
             "win_rate": win_rate,
             "account_balance": self.account_balance,
             "trading_enabled": self.trading_enabled,
@@ -583,7 +696,7 @@ class AutonomousTrader:
     async def update_performance_metrics(self):
         """Update performance metrics."""
         try:
-            metrics = self.oanda_client.get_performance_metrics(days=30)
+            metrics = await asyncio.to_thread(self.oanda_client.get_performance_metrics, days=30)
             if metrics:
                 self.performance_metrics = metrics
                 logger.info("Performance metrics updated", metrics=metrics)
@@ -593,11 +706,21 @@ class AutonomousTrader:
     async def update_correlation_matrix(self):
         """Update correlation matrix for risk management."""
         try:
-            correlation_data = self.oanda_client.calculate_correlation_matrix(
+            correlation_data = await asyncio.to_thread(
+                self.oanda_client.calculate_correlation_matrix,
                 self.trading_pairs, days=30
             )
             if correlation_data:
                 self.correlation_matrix = correlation_data
+                
+                # Dense array + index for vectorized correlation checks
+                matrix = correlation_data.get('correlation_matrix', {})
+                pairs = list(matrix)
+                self._corr = np.asarray(
+                    [[matrix[a].get(b, 0.0) for b in pairs] for a in pairs],
+                    dtype=np.float32
+                ).reshape(len(pairs), len(pairs))
+                self._pair_idx = {pair: i for i, pair in enumerate(pairs)}
                 logger.info("Correlation matrix updated", 
                            instruments=correlation_data['instruments'])
         except Exception as e:
@@ -637,17 +760,24 @@ class AutonomousTrader:
             if not self.correlation_matrix or not self.active_trades:
                 return True  # No correlation data or no active trades
             
-            correlation_matrix = self.correlation_matrix.get('correlation_matrix', {})
+            j = self._pair_idx.get(new_pair)
+            if j is None:
+                return True
+            
+            active_pairs = [trade.pair for trade in self.active_trades.values()
+                            if trade.pair in self._pair_idx]
+            if not active_pairs:
+                return True
             
-            for trade in self.active_trades.values():
-                if trade.pair in correlation_matrix and new_pair in correlation_matrix[trade.pair]:
-                    correlation = abs(correlation_matrix[trade.pair][new_pair])
-                    if correlation > self.max_correlation:
-                        logger.warning("High correlation detected", 
-                                      pair1=trade.pair, 
-                                      pair2=new_pair, 
-                                      correlation=correlation)
-                        return False
+            correlations = np.abs(self._corr[[self._pair_idx[p] for p in active_pairs], j])
+            too_high = correlations > self.max_correlation
+            if too_high.any():
+                i = int(too_high.argmax())
+                logger.warning("High correlation detected", 
+                              pair1=active_pairs[i], 
+                              pair2=new_pair, 
+                              correlation=float(correlations[i]))
+                return False
             
             return True
             
@@ -655,6 +785,22 @@ class AutonomousTrader:
             logger.error("Error checking correlation risk", error=str(e))
             return True  # Allow trade if correlation check fails
 
+    def _trail_stop(self, trade: ActiveTrade, price: float) -> Optional[float]:
+        """Ratchet a trade's stop loss toward `price`; return the new stop if it moved."""
+        trailing_distance = self.trailing_stop_distance * self._pip_size.get(trade.pair, 0.0001)
+        
+        if trade.side == "BUY":
+            new_stop_loss = price - trailing_distance
+            if new_stop_loss <= trade.stop_loss:
+                return None
+        else:
+            new_stop_loss = price + trailing_distance
+            if new_stop_loss >= trade.stop_loss:
+                return None
+        
+        trade.stop_loss = new_stop_loss
+        return new_stop_loss
+
     async def add_trailing_stop(self, trade_id: str):
         """Add trailing stop to an existing trade."""
         try:
@@ -667,50 +813,61 @@ class AutonomousTrader:
             if not current_price:
                 return
             
-            if trade.side == "BUY":
-                new_stop_loss = current_price - (self.trailing_stop_distance * 0.0001)
-                if new_stop_loss > trade.stop_loss:
-                    # Update stop loss
-                    trade.stop_loss = new_stop_loss
-                    
-                    # Update OANDA order if it's a real trade
-                    if not trade_id.startswith("auto_"):
-                        self.oanda_client.update_trade(trade_id, {
-                            "stopLoss": str(new_stop_loss)
-                        })
-                    
-                    logger.info("Trailing stop updated", 
-                               trade_id=trade_id,
-                               new_stop_loss=new_stop_loss)
+            new_stop_loss = self._trail_stop(trade, current_price)
+            if new_stop_loss is None:
+                return
             
-            elif trade.side == "SELL":
-                new_stop_loss = current_price + (self.trailing_stop_distance * 0.0001)
-                if new_stop_loss < trade.stop_loss:
-                    # Update stop loss
-                    trade.stop_loss = new_stop_loss
-                    
-                    # Update OANDA order if it's a real trade
-                    if not trade_id.startswith("auto_"):
-                        self.oanda_client.update_trade(trade_id, {
-                            "stopLoss": str(new_stop_loss)
-                        })
+            # Update OANDA order if it's a real trade
+            if not trade_id.startswith("auto_"):
+                await asyncio.to_thread(self.oanda_client.update_trade, trade_id, {
+                    "stopLoss": str(new_stop_loss)
+                })
+            
+            logger.info("Trailing stop updated", 
+                       trade_id=trade_id,
+                       new_stop_loss=new_stop_loss)
                     
+        except Exception as e:
+            logger.error("Error adding trailing stop", trade_id=trade_id, error=str(e))
+
+    async def _flush_trailing_stops(self):
+        """Push coalesced trailing-stop changes to OANDA at a fixed cadence."""
+        while self.is_running:
+            await asyncio.sleep(self.trailing_stop_flush_interval)
+            if not self._pending_stops:
+                continue
+            
+            # Last value per trade wins; drop trades closed since the tick
+            batch, self._pending_stops = self._pending_stops, {}
+            batch = {tid: sl for tid, sl in batch.items() if tid in self.active_trades}
+            
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.oanda_client.update_trade, tid, {"stopLoss": str(sl)})
+                  for tid, sl in batch.items()),
+                return_exceptions=True
+            )
+            
+            for (trade_id, new_stop_loss), result in zip(batch.items(), results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to update trailing stop via OANDA", 
+                                  trade_id=trade_id, 
+                                  error=str(result))
+                else:
                     logger.info("Trailing stop updated", 
                                trade_id=trade_id,
                                new_stop_loss=new_stop_loss)
-                    
-        except Exception as e:
-            logger.error("Error adding trailing stop", trade_id=trade_id, error=str(e))
 
     async def check_margin_requirements(self, pair: str, lot_size: float) -> bool:
         """Check if we have enough margin for a new position."""
         try:
             units = int(lot_size * 100000)
-            margin_req = self.oanda_client.get_margin_requirements(pair, units)
+            margin_req = await asyncio.to_thread(self.oanda_client.get_margin_requirements, pair, units)
             
             if margin_req:
                 margin_required = margin_req['margin_required']
-                has_margin = self.oanda_client.check_margin_availability(margin_required)
+                has_margin = await asyncio.to_thread(
+                    self.oanda_client.check_margin_availability, margin_required
+                )
                 
                 if not has_margin:
                     logger.warning("Insufficient margin for trade", 
@@ -745,28 +902,53 @@ class AutonomousTrader:
                     )
                 )
                 
+                # Process coalesced ticks and batch trailing-stop updates
+                self._tick_task = asyncio.create_task(self._tick_worker())
+                self._flush_task = asyncio.create_task(self._flush_trailing_stops())
+                
                 logger.info("Real-time streaming started")
                 
         except Exception as e:
             logger.error("Error starting streaming", error=str(e))
 
     async def handle_price_update(self, price_data: Dict):
-        """Handle real-time price updates."""
+        """Record a real-time price update; only the latest tick per instrument is kept."""
+        self._latest_tick[price_data.get('instrument')] = price_data
+        self._tick_event.set()
+
+    async def _tick_worker(self):
+        """Apply the most recent tick of each instrument to active trades."""
+        while self.is_running:
+            await self._tick_event.wait()
+            self._tick_event.clear()
+            
+            ticks, self._latest_tick = self._latest_tick, {}
+            for price_data in ticks.values():
+                self._process_price_update(price_data)
+
+    def _process_price_update(self, price_data: Dict):
+        """Update active trades and trailing stops from a pricing tick."""
         try:
             instrument = price_data.get('instrument')
-            bid = float(price_data.get('bids', [{}])[0].get('price', 0))
-            ask = float(price_data.get('asks', [{}])[0].get('price', 0))
+            bids = price_data.get('bids') or _EMPTY_BOOK
+            asks = price_data.get('asks') or _EMPTY_BOOK
+            bid = float(bids[0].get('price') or 0.0)
+            ask = float(asks[0].get('price') or 0.0)
+            mid = (bid + ask) * 0.5
             
             # Update active trades with new prices
-            for trade in self.active_trades.values():
-                if trade.pair == instrument:
-                    trade.current_price = (bid + ask) / 2
-                    
-                    # Check for trailing stop updates
-                    if self.use_trailing_stops:
-                        await self.add_trailing_stop(trade.trade_id)
+            trades = self._trades_by_instrument.get(instrument, ())
+            for trade in trades:
+                trade.current_price = mid
+                
+                # Ratchet trailing stops locally; OANDA is updated by the flush task
+                if self.use_trailing_stops:
+                    new_stop_loss = self._trail_stop(trade, mid)
+                    if new_stop_loss is not None and not trade.trade_id.startswith("auto_"):
+                        self._pending_stops[trade.trade_id] = new_stop_loss
             
-            logger.debug("Price update processed", instrument=instrument, bid=bid, ask=ask)
+            if _PRICE_LOG_DEBUG:
+                logger.debug("Price update processed", instrument=instrument, bid=bid, ask=ask)
             
         except Exception as e:
             logger.error("Error handling price update", error=str(e))
@@ -774,24 +956,9 @@ class AutonomousTrader:
     async def handle_transaction_update(self, transaction_data: Dict):
         """Handle real-time transaction updates."""
         try:
-            transaction_type = transaction_data.get('type')
-            trade_id = transaction_data.get('tradeID')
-            
-            if transaction_type == "ORDER_FILL":
-                # New trade opened
-                logger.info("New trade filled via streaming", trade_id=trade_id)
-                
-            elif transaction_type == "TRADE_CLOSE":
-                # Trade closed
-                logger.info("Trade closed via streaming", trade_id=trade_id)
-                
-            elif transaction_type == "STOP_LOSS_FILLED":
-                # Stop loss triggered
-                logger.info("Stop loss triggered", trade_id=trade_id)
-                
-            elif transaction_type == "TAKE_PROFIT_FILLED":
-                # Take profit triggered
-                logger.info("Take profit triggered", trade_id=trade_id)
+            message = _TRANSACTION_MESSAGES.get(transaction_data.get('type'))
+            if message:
+                logger.info(message, trade_id=transaction_data.get('tradeID'))
             
         except Exception as e:
             logger.error("Error handling transaction update", error=str(e))
@@ -802,4 +969,11 @@ async def main():
     await trader.start()
 
 if __name__ == "__main__":
+    # Prefer libuv's event loop for the streaming/REST I/O when installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
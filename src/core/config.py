@@ -4,9 +4,13 @@ Configuration management for the trading system.
 
 import os
 from typing import List, Optional, Dict, Any
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, validator
 
+# OANDA v20 REST API hosts per environment
+OANDA_PRACTICE_API_URL = "https://api-fxpractice.oanda.com"
+OANDA_LIVE_API_URL = "https://api-fxtrade.oanda.com"
+
 
 class DatabaseSettings(BaseSettings):
     """Database configuration."""
@@ -15,8 +19,7 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(default=20)
     echo: bool = Field(default=False)
     
-    class Config:
-        env_prefix = "DATABASE_"
+    model_config = SettingsConfigDict(env_prefix="DATABASE_", frozen=True)
 
 
 class RedisSettings(BaseSettings):
@@ -25,8 +28,7 @@ class RedisSettings(BaseSettings):
     db: int = Field(default=0)
     password: Optional[str] = None
     
-    class Config:
-        env_prefix = "REDIS_"
+    model_config = SettingsConfigDict(env_prefix="REDIS_", frozen=True)
 
 
 class BrokerSettings(BaseSettings):
@@ -36,10 +38,20 @@ class BrokerSettings(BaseSettings):
     api_secret: str = Field(default="")
     account_id: str = Field(default="")
     environment: str = Field(default="practice")  # practice or live
-    base_url: str = Field(default="https://api-fxpractice.oanda.com")
+    base_url: str = Field(default=OANDA_PRACTICE_API_URL)
+    
+    # REST endpoint resolved once from environment
+    _api_url: str
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve the environment-dependent API URL."""
+        self._api_url = OANDA_PRACTICE_API_URL if self.environment == "practice" else OANDA_LIVE_API_URL
     
-    class Config:
-        env_prefix = "BROKER_"
+    @property
+    def api_url(self) -> str:
+        return self._api_url
+    
+    model_config = SettingsConfigDict(env_prefix="BROKER_", frozen=True)
 
 
 class RiskSettings(BaseSettings):
@@ -64,6 +76,8 @@ class RiskSettings(BaseSettings):
         if not 0 <= v <= 1:
             raise ValueError("Correlation must be between 0 and 1")
         return v
+    
+    model_config = SettingsConfigDict(frozen=True)
 
 
 class TradingSettings(BaseSettings):
@@ -79,8 +93,7 @@ class TradingSettings(BaseSettings):
     update_interval: int = Field(default=60)  # seconds
     history_days: int = Field(default=30)  # days
     
-    class Config:
-        env_prefix = "TRADING_"
+    model_config = SettingsConfigDict(env_prefix="TRADING_", frozen=True)
 
 
 class MLSettings(BaseSettings):
@@ -101,8 +114,7 @@ class MLSettings(BaseSettings):
     rl_learning_rate: float = Field(default=0.001)
     rl_batch_size: int = Field(default=64)
     
-    class Config:
-        env_prefix = "ML_"
+    model_config = SettingsConfigDict(env_prefix="ML_", frozen=True)
 
 
 class MonitoringSettings(BaseSettings):
@@ -120,8 +132,7 @@ class MonitoringSettings(BaseSettings):
     log_level: str = Field(default="INFO")
     log_file: str = Field(default="./logs/trading.log")
     
-    class Config:
-        env_prefix = "MONITORING_"
+    model_config = SettingsConfigDict(env_prefix="MONITORING_", frozen=True)
 
 
 class ExternalServicesSettings(BaseSettings):
@@ -177,8 +188,7 @@ class ExternalServicesSettings(BaseSettings):
         "base_url": "https://api.eia.gov/v2"
     })
     
-    class Config:
-        env_prefix = "EXTERNAL_"
+    model_config = SettingsConfigDict(env_prefix="EXTERNAL_", frozen=True)
 
 
 class SecuritySettings(BaseSettings):
@@ -191,8 +201,7 @@ class SecuritySettings(BaseSettings):
     allowed_hosts: List[str] = Field(default=["*"])
     cors_origins: List[str] = Field(default=["*"])
     
-    class Config:
-        env_prefix = "SECURITY_"
+    model_config = SettingsConfigDict(env_prefix="SECURITY_", frozen=True)
 
 
 class Settings(BaseSettings):
@@ -229,13 +238,15 @@ class Settings(BaseSettings):
     def IS_PRODUCTION(self) -> bool:
         return self.environment == "production"
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
 
 
-# Global settings instance
+# Global settings instance, validated once at import and immutable afterwards
 settings = Settings()
 
 
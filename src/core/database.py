@@ -3,21 +3,32 @@ Database connection and session management.
 """
 
 import asyncio
+import time
 from typing import AsyncGenerator
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import DeclarativeBase
 import structlog
 
 from src.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
-# Create async engine
+# Engine settings, resolved once at import
+DATABASE_URL = settings.database.url.replace("postgresql://", "postgresql+asyncpg://")
+DATABASE_ECHO = settings.database.echo
+DATABASE_POOL_SIZE = 5 if settings.IS_DEVELOPMENT else settings.database.pool_size
+DATABASE_MAX_OVERFLOW = settings.database.max_overflow
+QUERY_CACHE_SIZE = 1200  # Compiled statement cache entries
+
+# Create async engine (pooled in every environment so connections are reused)
 engine = create_async_engine(
-    settings.database.url.replace("postgresql://", "postgresql+asyncpg://"),
-    echo=settings.database.echo,
-    poolclass=NullPool if settings.IS_DEVELOPMENT else None,
+    DATABASE_URL,
+    echo=DATABASE_ECHO,
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=DATABASE_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    query_cache_size=QUERY_CACHE_SIZE,
 )
 
 # Create session factory
@@ -28,7 +39,9 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 # Base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for ORM models."""
+    pass
 
 
 async def init_db():
@@ -65,12 +78,26 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Last connection check as (monotonic time, result), reused for DB_CHECK_TTL seconds
+DB_CHECK_TTL = 1.0
+_last_db_check = (float("-inf"), False)
+
+
 async def check_db_connection() -> bool:
     """Check database connection."""
+    global _last_db_check
+    checked_at, healthy = _last_db_check
+    now = time.monotonic()
+    if now - checked_at < DB_CHECK_TTL:
+        return healthy
+    
     try:
-        async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
-        return True
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        healthy = True
     except Exception as e:
         logger.error("Database connection check failed", error=str(e))
-        return False
+        healthy = False
+    
+    _last_db_check = (now, healthy)
+    return healthy
@@ -3,21 +3,35 @@ Structured logging configuration.
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory
 
 from src.core.config import settings
 
+def _orjson_serializer(obj: Any, default: Any = str, **_: Any) -> str:
+    """Serialize a log event with orjson; stdlib handlers expect str, not bytes."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Background thread that owns the file handler (see setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging():
     """Setup structured logging."""
+    global _log_listener
+    
     # Create logs directory
     log_path = Path(settings.monitoring.log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_level = getattr(logging, settings.monitoring.log_level.upper())
     
     # Configure structlog
     structlog.configure(
@@ -30,7 +44,7 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer)
         ],
         context_class=dict,
         logger_factory=LoggerFactory(),
@@ -42,16 +56,25 @@ def setup_logging():
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.monitoring.log_level.upper()),
+        level=log_level,
     )
     
-    # Add file handler
+    # Add file handler; disk writes happen on a listener thread, the
+    # calling thread only enqueues the record
     file_handler = logging.FileHandler(settings.monitoring.log_file)
     file_handler.setLevel(logging.INFO)
     
-    # Get root logger and add file handler
+    log_queue = queue.SimpleQueue()
+    if _log_listener is not None:
+        _log_listener.stop()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    
+    # Get root logger and add queue handler
     root_logger = logging.getLogger()
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Set specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -60,6 +83,14 @@ def setup_logging():
     logging.getLogger("celery").setLevel(logging.INFO)
 
 
+def shutdown_logging():
+    """Flush queued log records and stop the file-writer thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a structured logger."""
     return structlog.get_logger(name)
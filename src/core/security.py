@@ -4,19 +4,26 @@ Inspired by Vanta-ledger's NASA-grade security architecture.
 """
 
 import os
+import time
+import base64
+import asyncio
 import secrets
 import hashlib
 import hmac
-from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
+from cachetools import TTLCache
+import orjson
 import structlog
 
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-import redis
+import redis.asyncio as aioredis
 
 from src.core.config import settings
 
@@ -25,16 +32,82 @@ logger = structlog.get_logger(__name__)
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately slow; run it in worker processes off the event loop.
+# The pool is started on first use and shut down from the app lifespan.
+_BCRYPT_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _bcrypt_pool() -> ProcessPoolExecutor:
+    """Return the bcrypt worker pool, starting it on first use."""
+    global _BCRYPT_POOL
+    if _BCRYPT_POOL is None:
+        _BCRYPT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _BCRYPT_POOL
+
+
+def shutdown_bcrypt_pool():
+    """Shut down the bcrypt worker pool if it was started."""
+    global _BCRYPT_POOL
+    if _BCRYPT_POOL is not None:
+        _BCRYPT_POOL.shutdown(wait=False, cancel_futures=True)
+        _BCRYPT_POOL = None
+
+
+def _bcrypt_hash(password: str) -> str:
+    """Hash a password (runs in a bcrypt pool worker)."""
+    return pwd_context.hash(password)
+
+
+def _bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash (runs in a bcrypt pool worker)."""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
 # JWT token security
 security = HTTPBearer()
 
+# Settings read on every request, resolved once at import
+_SECRET_KEY = settings.security.secret_key
+_ALGORITHM = settings.security.algorithm
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.security.access_token_expire_minutes * 60
+REDIS_URL = settings.redis.url
+
+# HS256 tokens are signed directly; the header never changes
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"})).rstrip(b"=")
+_SECRET_KEY_BYTES = _SECRET_KEY.encode()
+
+
+def _encode_hs256(payload: Dict[str, Any], secret: bytes) -> str:
+    """Encode and sign an HS256 JWT without going through jose."""
+    body = _JWT_HEADER_B64 + b"." + base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    signature = base64.urlsafe_b64encode(hmac.new(secret, body, hashlib.sha256).digest()).rstrip(b"=")
+    return (body + b"." + signature).decode()
+
+# Upper bound on usernames tracked for failed logins / lockouts
+LOCKOUT_TRACKING_SIZE = 100_000
+
+# Master password lifetime in seconds
+MASTER_PASSWORD_TTL = 1800
+
+# Upper bound on memoized token decodes / password verifications
+VERIFY_CACHE_SIZE = 10_000
+
+# Number of most recent entries kept in the Redis audit log
+AUDIT_LOG_MAX_ENTRIES = 10_000
+
+# Audit entries are buffered and pushed to Redis in batches. A failed push
+# puts its batch back for the next flush, and close() flushes what is left;
+# entries still buffered when the process dies are lost.
+AUDIT_FLUSH_INTERVAL = 0.1
+AUDIT_FLUSH_BATCH = 256
+
 
 @dataclass
 class MasterPassword:
-    """Master password system for emergency access."""
+    """Master password system for emergency access (times are Unix epoch seconds)."""
     password: str
-    created_at: datetime
-    expires_at: datetime
+    created_at: float
+    expires_at: float
     attempts: int = 0
     max_attempts: int = 3
     is_used: bool = False
@@ -44,198 +117,249 @@ class SecurityManager:
     """Comprehensive security manager for the trading system."""
     
     def __init__(self):
-        self.redis_client = redis.Redis.from_url(settings.redis.url)
+        self.redis_client = aioredis.from_url(REDIS_URL)
         self.master_password: Optional[MasterPassword] = None
-        self.failed_attempts: Dict[str, int] = {}
-        self.locked_accounts: Dict[str, datetime] = {}
         
         # Security settings
         self.max_failed_attempts = 5
         self.lockout_duration = timedelta(minutes=30)
         self.session_timeout = timedelta(hours=24)
+        
+        # Bounded, self-expiring login failure tracking (per process)
+        lockout_seconds = self.lockout_duration.total_seconds()
+        self.failed_attempts: TTLCache = TTLCache(
+            maxsize=LOCKOUT_TRACKING_SIZE, ttl=lockout_seconds * 2
+        )
+        self.locked_accounts: TTLCache = TTLCache(  # username -> time.monotonic() unlock time
+            maxsize=LOCKOUT_TRACKING_SIZE, ttl=lockout_seconds
+        )
+        
+        # Memoized verifications: token -> (exp, payload), digest -> monotonic expiry
+        self._token_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._password_cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._password_cache_key = secrets.token_bytes(32)
+        
+        # Buffered audit entries, pushed to Redis by a background flusher
+        self._audit_buffer: deque = deque()
+        self._audit_flush_task: Optional[asyncio.Task] = None
     
-    def generate_master_password(self) -> str:
+    async def generate_master_password(self) -> str:
         """Generate a new master password for emergency access."""
         # Generate 64-character random password
         password = secrets.token_urlsafe(48)
         
         # Create master password object
+        now = time.time()
         self.master_password = MasterPassword(
             password=password,
-            created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(minutes=30),
+            created_at=now,
+            expires_at=now + MASTER_PASSWORD_TTL,
             max_attempts=3
         )
         
         # Store in Redis with expiration
-        self.redis_client.setex(
+        await self.redis_client.setex(
             f"master_password:{password}",
-            1800,  # 30 minutes
+            MASTER_PASSWORD_TTL,
             self.master_password.password
         )
         
         logger.warning("Master password generated", 
-                      expires_at=self.master_password.expires_at.isoformat())
+                      expires_at=datetime.fromtimestamp(self.master_password.expires_at, timezone.utc).isoformat())
         
         return password
     
     def verify_master_password(self, password: str) -> bool:
         """Verify master password for emergency access."""
-        if not self.master_password:
+        mp = self.master_password
+        if not mp:
             return False
         
         # Check if password is expired
-        if datetime.utcnow() > self.master_password.expires_at:
+        if time.time() > mp.expires_at:
             logger.warning("Master password expired")
             return False
         
         # Check if max attempts exceeded
-        if self.master_password.attempts >= self.master_password.max_attempts:
+        if mp.attempts >= mp.max_attempts:
             logger.warning("Master password max attempts exceeded")
             return False
         
         # Check if already used
-        if self.master_password.is_used:
+        if mp.is_used:
             logger.warning("Master password already used")
             return False
         
-        # Verify password
-        if password == self.master_password.password:
-            self.master_password.is_used = True
+        # Verify password (constant-time comparison)
+        if hmac.compare_digest(password.encode("utf-8"), mp.password.encode("utf-8")):
+            mp.is_used = True
             logger.info("Master password verified successfully")
             return True
         
-        self.master_password.attempts += 1
+        mp.attempts += 1
         logger.warning("Master password verification failed", 
-                      attempts=self.master_password.attempts)
+                      attempts=mp.attempts)
         return False
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token."""
         to_encode = data.copy()
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+        lifetime = expires_delta.total_seconds() if expires_delta else _ACCESS_TOKEN_EXPIRE_SECONDS
+        to_encode.update({"exp": int(time.time() + lifetime)})
+        if _ALGORITHM == "HS256":
+            encoded_jwt = _encode_hs256(to_encode, _SECRET_KEY_BYTES)
         else:
-            expire = datetime.utcnow() + timedelta(minutes=settings.security.access_token_expire_minutes)
-        
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.security.secret_key, algorithm=settings.security.algorithm)
+            encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
         
         return encoded_jwt
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Verify JWT token."""
+        """Verify JWT token, reusing the decoded payload until it expires."""
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            exp, payload = cached
+            if time.time() <= exp:
+                return payload
+            del self._token_cache[token]
+        
         try:
-            payload = jwt.decode(token, settings.security.secret_key, algorithms=[settings.security.algorithm])
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
             username: str = payload.get("sub")
             
             if username is None:
                 return None
             
+            exp = payload.get("exp")
+            if exp is not None:
+                self._token_cache[token] = (exp, payload)
+                if len(self._token_cache) > VERIFY_CACHE_SIZE:
+                    self._token_cache.popitem(last=False)
+            
             return payload
         except JWTError:
             return None
     
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash password using bcrypt."""
-        return pwd_context.hash(password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_bcrypt_pool(), _bcrypt_hash, password)
     
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password against hash; successful checks are remembered for a session."""
+        key = hmac.new(
+            self._password_cache_key,
+            f"{plain_password}\0{hashed_password}".encode("utf-8"),
+            hashlib.sha256
+        ).digest()
+        now = time.monotonic()
+        
+        expires = self._password_cache.get(key)
+        if expires is not None:
+            if now < expires:
+                return True
+            del self._password_cache[key]
+        
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(
+            _bcrypt_pool(), _bcrypt_verify, plain_password, hashed_password
+        ):
+            return False
+        
+        self._password_cache[key] = now + self.session_timeout.total_seconds()
+        if len(self._password_cache) > VERIFY_CACHE_SIZE:
+            self._password_cache.popitem(last=False)
+        return True
     
     def check_account_lockout(self, username: str) -> bool:
         """Check if account is locked due to failed attempts."""
-        if username in self.locked_accounts:
-            lockout_time = self.locked_accounts[username]
-            if datetime.utcnow() < lockout_time:
+        lockout_time = self.locked_accounts.get(username)
+        if lockout_time is not None:
+            if time.monotonic() < lockout_time:
                 return True
             else:
                 # Remove lockout if expired
-                del self.locked_accounts[username]
-                self.failed_attempts[username] = 0
+                self.locked_accounts.pop(username, None)
+                self.failed_attempts.pop(username, None)
         
         return False
     
     def record_failed_attempt(self, username: str):
         """Record a failed login attempt."""
-        if username not in self.failed_attempts:
-            self.failed_attempts[username] = 0
+        attempts = self.failed_attempts.get(username, 0) + 1
+        self.failed_attempts[username] = attempts
         
-        self.failed_attempts[username] += 1
-        
-        if self.failed_attempts[username] >= self.max_failed_attempts:
-            self.locked_accounts[username] = datetime.utcnow() + self.lockout_duration
+        if attempts >= self.max_failed_attempts:
+            lockout_seconds = self.lockout_duration.total_seconds()
+            self.locked_accounts[username] = time.monotonic() + lockout_seconds
             logger.warning("Account locked due to failed attempts", 
                           username=username, 
-                          lockout_until=self.locked_accounts[username].isoformat())
+                          lockout_until=datetime.fromtimestamp(time.time() + lockout_seconds, timezone.utc).isoformat())
     
     def reset_failed_attempts(self, username: str):
         """Reset failed attempts for successful login."""
-        if username in self.failed_attempts:
-            del self.failed_attempts[username]
-        if username in self.locked_accounts:
-            del self.locked_accounts[username]
+        self.failed_attempts.pop(username, None)
+        self.locked_accounts.pop(username, None)
     
-    def generate_session_token(self, user_id: str) -> str:
+    async def generate_session_token(self, user_id: str) -> str:
         """Generate session token for user."""
+        now = time.time()
         session_data = {
             "user_id": user_id,
-            "created_at": datetime.utcnow().isoformat(),
-            "expires_at": (datetime.utcnow() + self.session_timeout).isoformat()
+            "created_at": now,
+            "expires_at": now + self.session_timeout.total_seconds()
         }
         
         session_token = secrets.token_urlsafe(32)
         
         # Store session in Redis
-        self.redis_client.setex(
+        await self.redis_client.setex(
             f"session:{session_token}",
             int(self.session_timeout.total_seconds()),
-            str(session_data)
+            orjson.dumps(session_data)
         )
         
         return session_token
     
-    def validate_session_token(self, session_token: str) -> Optional[Dict[str, Any]]:
+    async def validate_session_token(self, session_token: str) -> Optional[Dict[str, Any]]:
         """Validate session token."""
-        session_data = self.redis_client.get(f"session:{session_token}")
+        session_data = await self.redis_client.get(f"session:{session_token}")
         
         if not session_data:
             return None
         
         # Parse session data
         try:
-            import json
-            session = json.loads(session_data)
-            expires_at = datetime.fromisoformat(session["expires_at"])
+            session = orjson.loads(session_data)
             
-            if datetime.utcnow() > expires_at:
+            if time.time() > session["expires_at"]:
                 # Remove expired session
-                self.redis_client.delete(f"session:{session_token}")
+                await self.redis_client.delete(f"session:{session_token}")
                 return None
             
             return session
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
             return None
     
-    def revoke_session_token(self, session_token: str):
+    async def revoke_session_token(self, session_token: str):
         """Revoke session token."""
-        self.redis_client.delete(f"session:{session_token}")
+        await self.redis_client.delete(f"session:{session_token}")
     
-    def create_audit_log(self, user_id: str, action: str, details: Dict[str, Any]):
+    async def create_audit_log(self, user_id: str, action: str, details: Dict[str, Any]):
         """Create audit log entry."""
         audit_entry = {
             "user_id": user_id,
             "action": action,
             "details": details,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "ip_address": "unknown",  # Would be extracted from request
             "user_agent": "unknown"   # Would be extracted from request
         }
         
-        # Store in Redis for immediate access
-        self.redis_client.lpush("audit_log", str(audit_entry))
+        # Queue for Redis; the flusher batches entries into one round trip
+        self._audit_buffer.append(audit_entry)
+        if self._audit_flush_task is None or self._audit_flush_task.done():
+            self._audit_flush_task = asyncio.create_task(self._audit_flush_loop())
         
         # Also store in database for persistence
         # This would be implemented with database models
@@ -245,35 +369,75 @@ class SecurityManager:
                    action=action, 
                    details=details)
     
+    async def flush_audit_log(self):
+        """Push buffered audit entries to Redis in batches."""
+        while self._audit_buffer:
+            count = min(AUDIT_FLUSH_BATCH, len(self._audit_buffer))
+            entries = [self._audit_buffer.popleft() for _ in range(count)]
+            
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.lpush("audit_log", *(orjson.dumps(entry, default=str) for entry in entries))
+                pipe.ltrim("audit_log", 0, AUDIT_LOG_MAX_ENTRIES - 1)
+                await pipe.execute()
+            except BaseException:
+                # Put the batch back in order so the next flush retries it
+                self._audit_buffer.extendleft(reversed(entries))
+                raise
+    
+    async def _audit_flush_loop(self):
+        """Flush the audit buffer every AUDIT_FLUSH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(AUDIT_FLUSH_INTERVAL)
+            try:
+                await self.flush_audit_log()
+            except Exception as e:
+                logger.error("Audit log flush failed", error=str(e))
+    
+    async def close(self):
+        """Stop the audit flusher and push any buffered entries."""
+        task, self._audit_flush_task = self._audit_flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        try:
+            await self.flush_audit_log()
+        except Exception as e:
+            logger.error("Final audit log flush failed", error=str(e), pending=len(self._audit_buffer))
+    
     def check_permission(self, user_id: str, resource: str, action: str) -> bool:
         """Check if user has permission for resource and action."""
         # This would implement role-based access control
         # For now, return True for all authenticated users
         return True
     
-    def generate_emergency_token(self) -> str:
+    async def generate_emergency_token(self) -> str:
         """Generate emergency access token."""
         token = secrets.token_urlsafe(32)
         
         # Store emergency token with short expiration
-        self.redis_client.setex(
+        await self.redis_client.setex(
             f"emergency_token:{token}",
             300,  # 5 minutes
-            datetime.utcnow().isoformat()
+            datetime.now(timezone.utc).isoformat()
         )
         
         logger.warning("Emergency token generated", token=token)
         return token
     
-    def verify_emergency_token(self, token: str) -> bool:
+    async def verify_emergency_token(self, token: str) -> bool:
         """Verify emergency access token."""
-        token_data = self.redis_client.get(f"emergency_token:{token}")
+        token_data = await self.redis_client.get(f"emergency_token:{token}")
         
         if not token_data:
             return False
         
         # Remove token after use
-        self.redis_client.delete(f"emergency_token:{token}")
+        await self.redis_client.delete(f"emergency_token:{token}")
         
         logger.warning("Emergency token used", token=token)
         return True
@@ -311,9 +475,9 @@ def require_master_password(password: str) -> bool:
     return security_manager.verify_master_password(password)
 
 
-def create_audit_entry(user_id: str, action: str, details: Dict[str, Any]):
+async def create_audit_entry(user_id: str, action: str, details: Dict[str, Any]):
     """Create audit log entry."""
-    security_manager.create_audit_log(user_id, action, details)
+    await security_manager.create_audit_log(user_id, action, details)
 
 
 def check_permissions(user_id: str, resource: str, action: str) -> bool:
@@ -4,17 +4,22 @@ Production-hardened with WebSocket connections, caching, and resilience.
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Union
 from datetime import datetime, timezone
 import aiohttp
+import numpy as np
+import orjson
 import websockets
+import xxhash
+import zstandard as zstd
 import redis.asyncio as redis
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
+import random
 import time
-import backoff
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +31,7 @@ class DataSource(Enum):
     YFINANCE = "yfinance"
     ALPHA_VANTAGE = "alpha_vantage"
 
-@dataclass
+@dataclass(slots=True)
 class DataPoint:
     """Standardized data point structure."""
     symbol: str
@@ -40,52 +45,103 @@ class DataPoint:
     raw_data: Dict[str, Any]
 
 class CircuitBreaker:
-    """Circuit breaker pattern for API protection."""
+    """Circuit breaker pattern for API protection.
     
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60):
+    Each consecutive trip doubles the open-state cooldown, starting at
+    `recovery_timeout` and capped at `max_timeout`; a successful
+    half-open call resets it.
+    """
+    
+    __slots__ = (
+        'failure_threshold', 'recovery_timeout', 'max_timeout', 'failure_count',
+        'last_failure_time', 'state', 'cooldown', '_consecutive_trips', '_on_state_change'
+    )
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60,
+                 max_timeout: int = 900, on_state_change: Optional[Callable[[str], None]] = None):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.max_timeout = max_timeout
         self.failure_count = 0
         self.last_failure_time = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self.cooldown = recovery_timeout
+        self._consecutive_trips = 0
+        self._on_state_change = on_state_change
     
-    def call(self, func: Callable, *args, **kwargs):
-        """Execute function with circuit breaker protection."""
+    def _set_state(self, state: str):
+        self.state = state
+        if self._on_state_change:
+            self._on_state_change(state)
+    
+    def _before_call(self):
+        """Move OPEN to HALF_OPEN once the cooldown expires, else reject."""
         if self.state == "OPEN":
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = "HALF_OPEN"
+            if time.time() - self.last_failure_time > self.cooldown:
+                self._set_state("HALF_OPEN")
             else:
                 raise Exception("Circuit breaker is OPEN")
+    
+    def _on_success(self):
+        if self.state == "HALF_OPEN":
+            self._set_state("CLOSED")
+            self.failure_count = 0
+            self._consecutive_trips = 0
+    
+    def _on_failure(self):
+        self.failure_count += 1
+        self.last_failure_time = time.time()
+        
+        if self.failure_count >= self.failure_threshold:
+            self.cooldown = min(self.recovery_timeout * 2 ** self._consecutive_trips, self.max_timeout)
+            self._consecutive_trips += 1
+            self._set_state("OPEN")
+    
+    def record_failure(self):
+        """Count a failure observed outside `call`/`acall`."""
+        self._on_failure()
+    
+    def call(self, func: Callable, *args, **kwargs):
+        """Execute function with circuit breaker protection."""
+        self._before_call()
         
         try:
             result = func(*args, **kwargs)
-            if self.state == "HALF_OPEN":
-                self.state = "CLOSED"
-                self.failure_count = 0
+            self._on_success()
             return result
         except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.failure_count >= self.failure_threshold:
-                self.state = "OPEN"
-            
+            self._on_failure()
+            raise e
+    
+    async def acall(self, coro_factory: Callable, *args, **kwargs):
+        """Await `coro_factory(*args, **kwargs)` with circuit breaker protection."""
+        self._before_call()
+        
+        try:
+            result = await coro_factory(*args, **kwargs)
+            self._on_success()
+            return result
+        except Exception as e:
+            self._on_failure()
             raise e
 
 class RateLimiter:
     """Rate limiter for API protection."""
     
+    __slots__ = ('max_requests', 'time_window', 'requests')
+    
     def __init__(self, max_requests: int, time_window: int):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self.requests = deque()
     
     async def acquire(self):
         """Acquire rate limit permit."""
-        now = time.time()
+        now = time.monotonic()
         
-        # Remove old requests
-        self.requests = [req for req in self.requests if now - req < self.time_window]
+        # Remove old requests (oldest first)
+        while self.requests and now - self.requests[0] >= self.time_window:
+            self.requests.popleft()
         
         if len(self.requests) >= self.max_requests:
             sleep_time = self.time_window - (now - self.requests[0])
@@ -94,69 +150,238 @@ class RateLimiter:
         
         self.requests.append(now)
 
+# Cached payloads larger than this are zstd-compressed
+CACHE_COMPRESS_THRESHOLD = 512
+
+# One-byte tag in front of every cached value
+_CACHE_PLAIN = b"\x00"
+_CACHE_ZSTD = b"\x01"
+
+
 class DataCache:
-    """Redis-based data cache with TTL."""
+    """Redis-based data cache with TTL.
+    
+    Values are stored as a one-byte tag followed by JSON, zstd-compressed
+    above CACHE_COMPRESS_THRESHOLD bytes. Untagged values written before
+    compression was introduced are read as plain JSON.
+    """
     
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    __slots__ = (
+        'redis_url', 'redis_client', 'max_connections', 'batch_size', 'batch_delay',
+        '_write_queue', '_flush_task', '_zc', '_zd'
+    )
+    
+    def __init__(self, redis_url: str = "redis://localhost:6379",
+                 batch_size: int = 128, batch_delay: float = 0.005,
+                 max_connections: int = 64):
         self.redis_url = redis_url
         self.redis_client = None
+        self.max_connections = max_connections
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._zc = zstd.ZstdCompressor(level=1)
+        self._zd = zstd.ZstdDecompressor()
+    
+    def _pack(self, raw: bytes) -> bytes:
+        """Tag (and compress, if large) serialized JSON for storage."""
+        if len(raw) > CACHE_COMPRESS_THRESHOLD:
+            return _CACHE_ZSTD + self._zc.compress(raw)
+        return _CACHE_PLAIN + raw
+    
+    def _unpack(self, stored: bytes) -> bytes:
+        """Inverse of `_pack`."""
+        tag = stored[:1]
+        if tag == _CACHE_ZSTD:
+            return self._zd.decompress(stored[1:])
+        if tag == _CACHE_PLAIN:
+            return stored[1:]
+        return stored
     
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.redis_client = redis.from_url(self.redis_url)
+            # Explicitly sized pool shared by direct reads/writes and the flusher
+            pool = redis.ConnectionPool.from_url(self.redis_url, max_connections=self.max_connections)
+            self.redis_client = redis.Redis(connection_pool=pool)
             await self.redis_client.ping()
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_loop())
             logger.info("Connected to Redis cache")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.redis_client = None
     
-    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+    async def get(self, key: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """Get data from cache."""
         if not self.redis_client:
             return None
         
         try:
             data = await self.redis_client.get(key)
-            return json.loads(data) if data else None
+            return orjson.loads(self._unpack(data)) if data else None
         except Exception as e:
             logger.error(f"Cache get error: {e}")
             return None
     
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """Get the stored bytes for a key without parsing them."""
+        if not self.redis_client:
+            return None
+        
+        try:
+            data = await self.redis_client.get(key)
+            return self._unpack(data) if data else None
+        except Exception as e:
+            logger.error(f"Cache get error: {e}")
+            return None
+    
+    async def set_raw(self, key: str, raw: bytes, ttl: int = 300):
+        """Store already-serialized JSON bytes with TTL."""
+        if not self.redis_client:
+            return
+        
+        try:
+            await self.redis_client.setex(key, ttl, self._pack(raw))
+        except Exception as e:
+            logger.error(f"Cache set error: {e}")
+    
     async def set(self, key: str, data: Dict[str, Any], ttl: int = 300):
         """Set data in cache with TTL."""
         if not self.redis_client:
             return
         
         try:
-            await self.redis_client.setex(key, ttl, json.dumps(data))
+            await self.redis_client.setex(key, ttl, self._pack(orjson.dumps(data)))
         except Exception as e:
             logger.error(f"Cache set error: {e}")
+    
+    def set_batched(self, key: Union[str, bytes], data: Dict[str, Any], ttl: int = 300):
+        """Queue a cache write; the flusher sends queued writes in one pipeline."""
+        if not self.redis_client:
+            return
+        
+        self._write_queue.put_nowait((key, ttl, self._pack(orjson.dumps(data))))
+    
+    async def _flush_loop(self):
+        """Drain queued writes every `batch_delay` or `batch_size` ops."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._write_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, ttl, value in batch:
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+            except Exception as e:
+                logger.error(f"Cache batch write error: {e}")
+    
+    async def close(self):
+        """Stop the batch flusher and close the Redis connection."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        if self.redis_client:
+            await self.redis_client.close(close_connection_pool=True)
+            self.redis_client = None
+
+# Largest inbound WebSocket frame accepted (4 MiB)
+WS_MAX_MESSAGE_SIZE = 2 ** 22
+
+# Parsed messages buffered between the socket reader and the handler
+WS_INBOUND_QUEUE_SIZE = 8192
+
+# Most outbound messages written per writer wakeup
+WS_SEND_BATCH = 32
+
+# Recent ticks kept in memory per (source, symbol)
+LATEST_RING_SIZE = 1024
+
 
 class WebSocketManager:
     """WebSocket connection manager with reconnection logic."""
     
-    def __init__(self, url: str, on_message: Callable, on_error: Callable = None):
+    __slots__ = (
+        'url', 'on_message', 'on_error', 'on_connection_change', 'on_reconnect_exhausted',
+        'websocket', 'running', 'reconnect_delay', 'max_reconnect_delay',
+        'max_reconnect_attempts', '_consecutive_failures', 'queue', 'dropped', '_consumer_task',
+        'out_queue', '_writer_task'
+    )
+    
+    def __init__(self, url: str, on_message: Callable, on_error: Callable = None,
+                 on_connection_change: Optional[Callable[[int], None]] = None,
+                 on_reconnect_exhausted: Optional[Callable[[], None]] = None,
+                 max_reconnect_attempts: int = 20):
         self.url = url
         self.on_message = on_message
         self.on_error = on_error
+        self.on_connection_change = on_connection_change
+        self.on_reconnect_exhausted = on_reconnect_exhausted
         self.websocket = None
         self.running = False
         self.reconnect_delay = 1
         self.max_reconnect_delay = 60
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self._consecutive_failures = 0
+        
+        # Reader and handler are decoupled; when the handler falls behind
+        # the oldest queued message is dropped so the socket keeps draining
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=WS_INBOUND_QUEUE_SIZE)
+        self.dropped = 0
+        self._consumer_task: Optional[asyncio.Task] = None
+        
+        # Outbound messages, written in batches by a single writer task
+        self.out_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+    
+    def _set_websocket(self, websocket):
+        """Swap the live connection, reporting connect/disconnect (+1/-1)."""
+        delta = (websocket is not None) - (self.websocket is not None)
+        self.websocket = websocket
+        if delta and self.on_connection_change:
+            self.on_connection_change(delta)
     
     async def connect(self):
-        """Connect to WebSocket with exponential backoff."""
+        """Connect to WebSocket with decorrelated-jitter backoff.
+        
+        Gives up (stopping the manager) after `max_reconnect_attempts`
+        consecutive failures.
+        """
         while self.running:
             try:
-                self.websocket = await websockets.connect(self.url)
+                self._set_websocket(await websockets.connect(self.url, max_size=WS_MAX_MESSAGE_SIZE))
                 self.reconnect_delay = 1
+                self._consecutive_failures = 0
                 logger.info(f"Connected to WebSocket: {self.url}")
                 return True
             except Exception as e:
                 logger.error(f"WebSocket connection failed: {e}")
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= self.max_reconnect_attempts:
+                    logger.error(f"Giving up on WebSocket after {self._consecutive_failures} attempts: {self.url}")
+                    self.running = False
+                    if self.on_reconnect_exhausted:
+                        self.on_reconnect_exhausted()
+                    break
+                
                 await asyncio.sleep(self.reconnect_delay)
-                self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
+                self.reconnect_delay = min(self.max_reconnect_delay, random.uniform(1.0, self.reconnect_delay * 3))
         
         return False
     
@@ -173,61 +398,146 @@ class WebSocketManager:
                         break
                     
                     try:
-                        data = json.loads(message)
-                        await self.on_message(data)
+                        data = orjson.loads(message)
                     except Exception as e:
                         logger.error(f"Message processing error: {e}")
                         if self.on_error:
                             await self.on_error(e)
+                        continue
+                    
+                    try:
+                        self.queue.put_nowait(data)
+                    except asyncio.QueueFull:
+                        self.dropped += 1
+                        self.queue.get_nowait()
+                        self.queue.put_nowait(data)
+                
+                # Clean close by the server ends iteration without raising
+                if self.running:
+                    logger.warning("WebSocket connection closed")
+                    self._set_websocket(None)
             
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("WebSocket connection closed")
-                self.websocket = None
+                self._set_websocket(None)
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
-                self.websocket = None
+                self._set_websocket(None)
+    
+    async def _consume(self):
+        """Hand queued messages to the message callback."""
+        while True:
+            data = await self.queue.get()
+            try:
+                await self.on_message(data)
+            except Exception as e:
+                logger.error(f"Message processing error: {e}")
+                if self.on_error:
+                    await self.on_error(e)
     
     async def send(self, message: str):
-        """Send message through WebSocket."""
-        if self.websocket:
+        """Queue a message for the writer task."""
+        self.out_queue.put_nowait(message)
+    
+    async def _writer(self):
+        """Write queued messages, draining up to WS_SEND_BATCH per wakeup."""
+        while self.running:
+            batch = [await self.out_queue.get()]
+            while len(batch) < WS_SEND_BATCH and not self.out_queue.empty():
+                batch.append(self.out_queue.get_nowait())
+            
+            if not self.websocket:
+                continue
+            
             try:
-                await self.websocket.send(message)
+                for message in batch:
+                    await self.websocket.send(message)
             except Exception as e:
                 logger.error(f"WebSocket send error: {e}")
-                self.websocket = None
+                self._set_websocket(None)
     
     async def start(self):
         """Start WebSocket manager."""
         self.running = True
-        await self.listen()
+        self._consumer_task = asyncio.create_task(self._consume())
+        self._writer_task = asyncio.create_task(self._writer())
+        try:
+            await self.listen()
+        finally:
+            self._consumer_task.cancel()
+            self._writer_task.cancel()
     
     async def stop(self):
         """Stop WebSocket manager."""
         self.running = False
         if self.websocket:
             await self.websocket.close()
+            self._set_websocket(None)
 
 class RealTimeDataIngestion:
     """Production-hardened real-time data ingestion system."""
     
-    def __init__(self, cache_url: str = "redis://localhost:6379"):
+    def __init__(self, cache_url: str = "redis://localhost:6379",
+                 connection_limit: int = 200, connection_limit_per_host: int = 30,
+                 max_in_flight_per_source: int = 20):
         self.cache = DataCache(cache_url)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
         self.circuit_breakers = {}
         self.rate_limiters = {}
+        self.source_sem = {}
+        # Enum .value goes through a descriptor; hot paths index these instead
+        self._src_str = {source: source.value for source in DataSource}
+        self._source_prefix = {source: source.value.encode() + b":" for source in DataSource}
+        self._health_ts = (0, "")
+        
+        # (source, symbol) -> columnar ring of recent ticks; Redis is the mirror
+        self.latest: Dict[tuple, Dict[str, Any]] = {}
         self.websocket_managers = {}
+        self._ws_tasks: list[asyncio.Task] = []
         self.data_handlers = {}
         self.running = False
         
+        # Health counters, kept current by connection/state-change callbacks
+        self._open_ws_count = 0
+        self._cb_state_snapshot: Dict[str, str] = {}
+        
         # Initialize circuit breakers and rate limiters
         for source in DataSource:
-            self.circuit_breakers[source] = CircuitBreaker()
+            self._cb_state_snapshot[source.value] = "CLOSED"
+            self.circuit_breakers[source] = CircuitBreaker(
+                on_state_change=partial(self._cb_state_snapshot.__setitem__, source.value)
+            )
             self.rate_limiters[source] = RateLimiter(max_requests=100, time_window=60)
+            self.source_sem[source] = asyncio.Semaphore(max_in_flight_per_source)
     
     async def initialize(self):
         """Initialize the ingestion system."""
         await self.cache.connect()
+        self._ensure_session()
+        
         logger.info("Real-time data ingestion system initialized")
     
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared REST session, (re)creating it if needed."""
+        # One pooled session for all REST fetches (keep-alive + DNS cache)
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+    
+    def _on_ws_connection_change(self, delta: int):
+        self._open_ws_count += delta
+    
     def register_data_handler(self, source: DataSource, handler: Callable):
         """Register data handler for a source."""
         self.data_handlers[source] = handler
@@ -235,69 +545,120 @@ class RealTimeDataIngestion:
     
     async def start_websocket_stream(self, source: DataSource, url: str, auth_headers: Dict = None):
         """Start WebSocket stream for a data source."""
+        src_name = self._src_str[source]
+        src_prefix = self._source_prefix[source]
+        
         async def message_handler(data: Dict[str, Any]):
             """Handle incoming WebSocket messages."""
+            sym = data.get('symbol', 'unknown')
+            if type(sym) is not str:
+                sym = str(sym)  # null / numeric symbols keyed as the f-string did
+            ts = data.get('t') or time.time_ns() // 1_000_000
             try:
-                # Cache the data
-                cache_key = f"{source.value}:{data.get('symbol', 'unknown')}:{int(time.time())}"
-                await self.cache.set(cache_key, data, ttl=300)
+                # Cache the data, keyed by the payload timestamp when present (ms otherwise)
+                cache_key = src_prefix + sym.encode() + b":" + str(ts).encode()
+                self.cache.set_batched(cache_key, data, ttl=300)
                 
                 # Process with registered handler
                 if source in self.data_handlers:
                     await self.data_handlers[source](data)
                 
-                logger.debug(f"Processed {source.value} data: {data.get('symbol', 'unknown')}")
+                logger.debug("Processed %s data: %s", src_name, sym)
+            except Exception as e:
+                logger.error(f"Error processing {src_name} data: {e}")
+            
+            # Guarded separately so a malformed tick cannot suppress delivery
+            try:
+                self._record_tick(source, sym, data, ts)
             except Exception as e:
-                logger.error(f"Error processing {source.value} data: {e}")
+                logger.error(f"Error recording {src_name} tick: {e}")
         
         async def error_handler(error: Exception):
             """Handle WebSocket errors."""
             logger.error(f"WebSocket error for {source.value}: {error}")
         
         # Create and start WebSocket manager
-        manager = WebSocketManager(url, message_handler, error_handler)
+        manager = WebSocketManager(
+            url, message_handler, error_handler,
+            on_connection_change=self._on_ws_connection_change,
+            on_reconnect_exhausted=self.circuit_breakers[source].record_failure
+        )
         self.websocket_managers[source] = manager
         
-        # Start in background
-        asyncio.create_task(manager.start())
+        # Start in background (kept so shutdown can cancel and await it)
+        self._ws_tasks.append(asyncio.create_task(manager.start()))
         logger.info(f"Started WebSocket stream for {source.value}")
     
     async def fetch_data_with_resilience(self, source: DataSource, url: str, 
-                                       params: Dict = None, headers: Dict = None) -> Optional[Dict[str, Any]]:
-        """Fetch data with circuit breaker and rate limiting."""
+                                       params: Dict = None, headers: Dict = None,
+                                       raise_errors: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch data with circuit breaker and rate limiting.
+        
+        Non-200 responses return None. Request failures (transport errors,
+        5xx, open circuit) also return None unless `raise_errors` is set.
+        """
+        src_name = self._src_str[source]
+        
+        # Stable across processes and independent of dict key order
+        params_hash = xxhash.xxh3_64_hexdigest(orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS))
+        cache_key = f"{src_name}:{url}:{params_hash}"
+        
         # Check cache first
-        cache_key = f"{source.value}:{url}:{hash(str(params))}"
         cached_data = await self.cache.get(cache_key)
         if cached_data:
-            logger.debug(f"Cache hit for {source.value}")
+            logger.debug("Cache hit for %s", src_name)
             return cached_data
         
         # Apply rate limiting
         await self.rate_limiters[source].acquire()
         
+        # Created on first use so fetches work without an explicit initialize()
+        session = self._ensure_session()
+        
+        async def request():
+            # Bound concurrent in-flight requests per source
+            async with self.source_sem[source]:
+                async with session.get(url, params=params, headers=headers) as response:
+                    # Server-side errors count against the circuit breaker
+                    if response.status >= 500:
+                        raise Exception(f"Upstream error {response.status}")
+                    return response.status, await response.read()
+        
         # Apply circuit breaker
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Cache successful response
-                        await self.cache.set(cache_key, data, ttl=60)
-                        
-                        return data
-                    else:
-                        logger.error(f"API error for {source.value}: {response.status}")
-                        return None
+            status, raw = await self.circuit_breakers[source].acall(request)
+            if status == 200:
+                # Cache the response body as-is; parse it once for the caller
+                await self.cache.set_raw(cache_key, raw, ttl=60)
+                
+                return orjson.loads(raw)
+            else:
+                logger.error(f"API error for {src_name}: {status}")
+                return None
         except Exception as e:
-            logger.error(f"Request error for {source.value}: {e}")
+            logger.error(f"Request error for {src_name}: {e}")
+            if raise_errors:
+                raise
             return None
     
-    @backoff.on_exception(backoff.expo, Exception, max_tries=3)
     async def fetch_with_retry(self, source: DataSource, url: str, 
-                             params: Dict = None, headers: Dict = None) -> Optional[Dict[str, Any]]:
-        """Fetch data with exponential backoff retry."""
-        return await self.fetch_data_with_resilience(source, url, params, headers)
+                             params: Dict = None, headers: Dict = None, max_tries: int = 3,
+                             base_delay: float = 1.0, max_delay: float = 30.0) -> Optional[Dict[str, Any]]:
+        """Fetch data, retrying failed requests with jittered exponential backoff.
+        
+        Only request failures are retried; other non-200 responses and
+        cancellation are not. Returns None once `max_tries` attempts fail.
+        """
+        for attempt in range(max_tries):
+            try:
+                return await self.fetch_data_with_resilience(source, url, params, headers, raise_errors=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if attempt == max_tries - 1:
+                    logger.error(f"Giving up on {self._src_str[source]} after {max_tries} attempts")
+                    return None
+                await asyncio.sleep(min(max_delay, base_delay * 2 ** attempt) * (0.5 + random.random()))
     
     async def start_all_streams(self):
         """Start all configured data streams."""
@@ -315,20 +676,73 @@ class RealTimeDataIngestion:
         """Stop all data streams."""
         self.running = False
         
-        for manager in self.websocket_managers.values():
-            await manager.stop()
+        # Close all connections concurrently, then reap the stream tasks
+        await asyncio.gather(*(m.stop() for m in self.websocket_managers.values()), return_exceptions=True)
+        for task in self._ws_tasks:
+            task.cancel()
+        await asyncio.gather(*self._ws_tasks, return_exceptions=True)
+        self._ws_tasks.clear()
+        
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        
+        await self.cache.close()
         
         logger.info("Stopped all data streams")
     
+    def _record_tick(self, source: DataSource, symbol: str, data: Dict[str, Any], ts: Any):
+        """Append a tick to the in-memory ring for (source, symbol)."""
+        ring = self.latest.get((source, symbol))
+        if ring is None:
+            ring = {
+                'open': np.empty(LATEST_RING_SIZE, np.float64),
+                'high': np.empty(LATEST_RING_SIZE, np.float64),
+                'low': np.empty(LATEST_RING_SIZE, np.float64),
+                'close': np.empty(LATEST_RING_SIZE, np.float64),
+                'volume': np.empty(LATEST_RING_SIZE, np.float64),
+                'ts': np.empty(LATEST_RING_SIZE, np.int64),
+                'idx': 0,
+                'raw': None
+            }
+            self.latest[(source, symbol)] = ring
+        
+        i = ring['idx'] % LATEST_RING_SIZE
+        ring['open'][i] = data.get('open', 0)
+        ring['high'][i] = data.get('high', 0)
+        ring['low'][i] = data.get('low', 0)
+        ring['close'][i] = data.get('close', 0)
+        ring['volume'][i] = data.get('volume', 0)
+        ring['ts'][i] = ts if isinstance(ts, int) else time.time_ns() // 1_000_000
+        ring['raw'] = data
+        ring['idx'] += 1
+    
     async def get_latest_data(self, symbol: str, source: DataSource) -> Optional[DataPoint]:
         """Get latest data for a symbol from a specific source."""
-        cache_key = f"{source.value}:{symbol}:latest"
+        ring = self.latest.get((source, symbol))
+        if ring is not None:
+            i = (ring['idx'] - 1) % LATEST_RING_SIZE
+            return DataPoint(
+                symbol=symbol,
+                timestamp=datetime.fromtimestamp(ring['ts'][i] / 1000, timezone.utc),
+                open=float(ring['open'][i]),
+                high=float(ring['high'][i]),
+                low=float(ring['low'][i]),
+                close=float(ring['close'][i]),
+                volume=float(ring['volume'][i]),
+                source=source,
+                raw_data=ring['raw']
+            )
+        
+        cache_key = self._source_prefix[source] + symbol.encode() + b":latest"
         data = await self.cache.get(cache_key)
         
         if data:
+            # Only fall back to "now" when the payload has no timestamp
+            ts = data.get('timestamp')
             return DataPoint(
                 symbol=data.get('symbol', symbol),
-                timestamp=datetime.fromisoformat(data.get('timestamp', datetime.now().isoformat())),
+                timestamp=datetime.fromisoformat(ts) if ts else datetime.now(),
                 open=float(data.get('open', 0)),
                 high=float(data.get('high', 0)),
                 low=float(data.get('low', 0)),
@@ -349,12 +763,17 @@ class RealTimeDataIngestion:
     
     def get_system_health(self) -> Dict[str, Any]:
         """Get system health status."""
+        # Timestamp has second resolution; format it at most once per second
+        now = int(time.time())
+        if now != self._health_ts[0]:
+            self._health_ts = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+        
         return {
             "running": self.running,
-            "websocket_connections": len([m for m in self.websocket_managers.values() if m.websocket]),
-            "circuit_breakers": {k.value: v.state for k, v in self.circuit_breakers.items()},
+            "websocket_connections": self._open_ws_count,
+            "circuit_breakers": dict(self._cb_state_snapshot),
             "cache_connected": self.cache.redis_client is not None,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": self._health_ts[1]
         }
 
 # Global instance
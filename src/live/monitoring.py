@@ -5,16 +5,19 @@ Health checks, performance metrics, and alerting for the trading system.
 
 import asyncio
 import logging
+import operator
+import os
 import time
 import psutil
-import json
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-import aiohttp
+import msgspec
+import numpy as np
+import orjson
 import redis.asyncio as redis
-from collections import defaultdict, deque
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +35,7 @@ class AlertLevel(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemMetrics:
     """System performance metrics."""
     cpu_usage: float
@@ -42,7 +45,7 @@ class SystemMetrics:
     uptime: float
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingMetrics:
     """Trading performance metrics."""
     total_trades: int
@@ -57,7 +60,7 @@ class TradingMetrics:
     total_pnl: float
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthCheck:
     """Health check result."""
     component: str
@@ -66,44 +69,304 @@ class HealthCheck:
     response_time: float
     timestamp: datetime
     details: Dict[str, Any] = field(default_factory=dict)
+    # Cached ISO form of timestamp; derived, so not a constructor argument
+    _timestamp_iso: str = field(init=False, repr=False, compare=False, default="")
+    
+    def __post_init__(self):
+        # Formatted once here rather than on every status request
+        object.__setattr__(self, "_timestamp_iso", self.timestamp.isoformat())
+
+# Response schemas: msgspec compiles an encoder per Struct type, so the
+# status endpoints skip building nested dicts on every request.
+
+class SysMetricsResp(msgspec.Struct):
+    """Latest system resource usage."""
+    cpu_usage: float
+    memory_usage: float
+    disk_usage: float
+
+class CurrentMetricsResp(msgspec.Struct):
+    """Latest system metrics including uptime."""
+    cpu_usage: float
+    memory_usage: float
+    disk_usage: float
+    uptime: float
+
+class MetricSampleResp(msgspec.Struct):
+    """One historical metrics sample."""
+    timestamp: str
+    cpu_usage: float
+    memory_usage: float
+    disk_usage: float
+
+class HealthCheckResp(msgspec.Struct):
+    """Health check as reported in system status."""
+    component: str
+    status: str
+    message: str
+    response_time: float
+    timestamp: str
+
+class AlertSummaryResp(msgspec.Struct):
+    """Alert counts and most recent alerts."""
+    total_alerts: int
+    alert_counts: Dict[str, int]
+    recent_alerts: List[Dict[str, Any]]
+    timestamp: str
+
+class SystemStatusResp(msgspec.Struct):
+    """Overall system status."""
+    status: str
+    running: bool
+    uptime: float
+    system_metrics: SysMetricsResp
+    health_checks: List[HealthCheckResp]
+    alerts: AlertSummaryResp
+    timestamp: str
+
+class PerformanceMetricsResp(msgspec.Struct, omit_defaults=True):
+    """Current, aggregate and recent system metrics."""
+    current: Optional[CurrentMetricsResp] = None
+    average: Optional[Dict[str, float]] = None
+    max: Optional[Dict[str, float]] = None
+    min: Optional[Dict[str, float]] = None
+    history: Optional[List[MetricSampleResp]] = None
+    error: Optional[str] = None
+
+_json_encoder = msgspec.json.Encoder()
+
+class DABA:
+    """De-Amortized Banker's Aggregator over a bounded FIFO window.
+    
+    Maintains the fold of an associative `op` over the window with O(1)
+    worst-case `insert`, `evict` and `query` (Tangwongsan et al., 2017).
+    The window is split into sublists F, L, R, A and B by the pointers
+    below; each `insert`/`evict` performs one constant step of the
+    incremental front rebuild.
+    """
+    
+    __slots__ = ('_op', '_identity', '_cap', '_vals', '_aggs',
+                 '_f', '_l', '_r', '_a', '_b', '_e')
+    
+    def __init__(self, op: Callable[[Any, Any], Any], identity: Any, capacity: int):
+        self._op = op
+        self._identity = identity
+        self._cap = capacity + 1
+        self._vals = [identity] * self._cap
+        self._aggs = [identity] * self._cap
+        self._f = self._l = self._r = self._a = self._b = self._e = 0
+    
+    def __len__(self) -> int:
+        return self._e - self._f
+    
+    def _sigma_f(self):
+        return self._aggs[self._f % self._cap] if self._f != self._b else self._identity
+    
+    def _sigma_b(self):
+        return self._aggs[(self._e - 1) % self._cap] if self._b != self._e else self._identity
+    
+    def _sigma_l(self):
+        return self._aggs[self._l % self._cap] if self._l != self._r else self._identity
+    
+    def _sigma_r(self):
+        return self._aggs[(self._a - 1) % self._cap] if self._r != self._a else self._identity
+    
+    def _sigma_a(self):
+        return self._aggs[self._a % self._cap] if self._a != self._b else self._identity
+    
+    def query(self):
+        """Fold of every value currently in the window."""
+        return self._op(self._sigma_f(), self._sigma_b())
+    
+    def insert(self, value):
+        """Append a value at the back of the window."""
+        i = self._e % self._cap
+        self._aggs[i] = self._op(self._sigma_b(), value)
+        self._vals[i] = value
+        self._e += 1
+        self._fixup()
+    
+    def evict(self):
+        """Drop the oldest value from the window."""
+        self._f += 1
+        self._fixup()
+    
+    def _fixup(self):
+        op = self._op
+        if self._f == self._b:
+            self._b = self._a = self._r = self._l = self._e
+            return
+        
+        if self._l == self._b:
+            # Flip: the back list becomes the front list still to be rebuilt
+            self._l = self._f
+            self._a = self._e
+            self._b = self._e
+        
+        if self._l == self._r:
+            # Shift
+            self._a += 1
+            self._r += 1
+            self._l += 1
+        else:
+            # Shrink: finish one element at each end of the rebuild
+            cap = self._cap
+            self._aggs[self._l % cap] = op(op(self._sigma_l(), self._sigma_r()), self._sigma_a())
+            self._l += 1
+            i = (self._a - 1) % cap
+            self._aggs[i] = op(self._vals[i], self._sigma_a())
+            self._a -= 1
+
+# Enough for the procfs files sampled below (only the first line of /proc/stat is used)
+PROC_READ_SIZE = 65536
 
 class PerformanceMonitor:
-    """System performance monitoring."""
+    """System performance monitoring.
     
-    def __init__(self):
-        self.metrics_history = deque(maxlen=1000)  # Keep last 1000 metrics
+    Metric history is kept as per-field NumPy ring buffers (one array per
+    metric); `latest_metrics` holds the most recent full sample.
+    """
+    
+    def __init__(self, history_size: int = 1000):
+        self.history_size = history_size  # Keep last 1000 metrics
+        self.cpu = np.zeros(history_size, np.float32)
+        self.mem = np.zeros(history_size, np.float32)
+        self.disk = np.zeros(history_size, np.float32)
+        self.ts = np.zeros(history_size, np.int64)  # epoch milliseconds
+        self.idx = 0
+        self.count = 0
+        self.latest_metrics: Optional[SystemMetrics] = None
+        
+        # Running (sum, min, max) over the window per metric, O(1) per sample
+        self.aggregates = {
+            name: (DABA(operator.add, 0.0, history_size),
+                   DABA(min, float("inf"), history_size),
+                   DABA(max, float("-inf"), history_size))
+            for name in ("cpu_usage", "memory_usage", "disk_usage")
+        }
         self.alert_thresholds = {
             "cpu_usage": 80.0,  # 80% CPU usage
             "memory_usage": 85.0,  # 85% memory usage
             "disk_usage": 90.0,  # 90% disk usage
             "response_time": 5.0,  # 5 seconds response time
         }
+        
+        # Thresholds as a vector matching the (cpu, mem, disk) column order
+        self._threshold_vec = np.array([
+            self.alert_thresholds["cpu_usage"],
+            self.alert_thresholds["memory_usage"],
+            self.alert_thresholds["disk_usage"]
+        ], np.float32)
+        
+        # procfs files stay open between samples and are re-read with pread
+        self._proc_fds: Dict[str, int] = {}
+        
+        # CPU jiffies from the previous sample; CPU% is the delta between samples
+        self._prev_cpu_total = 0
+        self._prev_cpu_idle = 0
     
-    async def collect_system_metrics(self) -> SystemMetrics:
-        """Collect system performance metrics."""
-        try:
-            # CPU usage
-            cpu_usage = psutil.cpu_percent(interval=1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_usage = memory.percent
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_usage = (disk.used / disk.total) * 100
-            
-            # Network I/O
-            network = psutil.net_io_counters()
-            network_io = {
+    def _append(self, cpu: float, mem: float, disk: float, ts: int):
+        """Write one sample into the ring buffers."""
+        full = self.count == self.history_size
+        for name, value in (("cpu_usage", cpu), ("memory_usage", mem), ("disk_usage", disk)):
+            for agg in self.aggregates[name]:
+                if full:
+                    agg.evict()
+                agg.insert(value)
+        
+        i = self.idx % self.history_size
+        self.cpu[i] = cpu
+        self.mem[i] = mem
+        self.disk[i] = disk
+        self.ts[i] = ts
+        self.idx += 1
+        self.count = min(self.count + 1, self.history_size)
+    
+    def tail_indices(self, n: int) -> np.ndarray:
+        """Ring positions of the last `n` samples, oldest first."""
+        n = min(n, self.count)
+        return np.arange(self.idx - n, self.idx) % self.history_size
+    
+    def _pread_proc(self, path: str) -> bytes:
+        """Read a procfs file from offset 0 through a cached descriptor."""
+        fd = self._proc_fds.get(path)
+        if fd is None:
+            fd = self._proc_fds[path] = os.open(path, os.O_RDONLY)
+        return os.pread(fd, PROC_READ_SIZE, 0)
+    
+    def close(self):
+        """Close cached procfs descriptors."""
+        for fd in self._proc_fds.values():
+            os.close(fd)
+        self._proc_fds.clear()
+    
+    def _read_proc(self):
+        """Read CPU, memory, disk, network and uptime straight from procfs."""
+        stat = self._pread_proc('/proc/stat')
+        fields = [int(v) for v in stat[:stat.index(b'\n')].split()[1:9]]
+        total = sum(fields)
+        idle = fields[3] + fields[4]  # idle + iowait
+        dtotal = total - self._prev_cpu_total
+        didle = idle - self._prev_cpu_idle
+        self._prev_cpu_total, self._prev_cpu_idle = total, idle
+        cpu_usage = 100.0 * (dtotal - didle) / dtotal if dtotal else 0.0
+        
+        meminfo = {}
+        for line in self._pread_proc('/proc/meminfo').splitlines():
+            key, value = line.split(b':', 1)
+            if key in (b'MemTotal', b'MemAvailable'):
+                meminfo[key] = int(value.split()[0])
+                if len(meminfo) == 2:
+                    break
+        memory_usage = 100.0 * (meminfo[b'MemTotal'] - meminfo[b'MemAvailable']) / meminfo[b'MemTotal']
+        
+        disk = os.statvfs('/')
+        disk_usage = (disk.f_blocks - disk.f_bfree) / disk.f_blocks * 100
+        
+        bytes_recv = packets_recv = bytes_sent = packets_sent = 0
+        for line in self._pread_proc('/proc/net/dev').splitlines()[2:]:
+            iface, data = line.split(b':', 1)
+            if iface.strip() == b'lo':
+                continue
+            cols = data.split()
+            bytes_recv += int(cols[0])
+            packets_recv += int(cols[1])
+            bytes_sent += int(cols[8])
+            packets_sent += int(cols[9])
+        network_io = {
+            "bytes_sent": bytes_sent,
+            "bytes_recv": bytes_recv,
+            "packets_sent": packets_sent,
+            "packets_recv": packets_recv
+        }
+        
+        uptime = float(self._pread_proc('/proc/uptime').split()[0])
+        
+        return cpu_usage, memory_usage, disk_usage, network_io, uptime
+    
+    def _read_psutil(self):
+        """Fallback for hosts without procfs (non-blocking CPU sample)."""
+        network = psutil.net_io_counters()
+        return (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            psutil.disk_usage('/').percent,
+            {
                 "bytes_sent": network.bytes_sent,
                 "bytes_recv": network.bytes_recv,
                 "packets_sent": network.packets_sent,
                 "packets_recv": network.packets_recv
-            }
-            
-            # Uptime
-            uptime = time.time() - psutil.boot_time()
+            },
+            time.time() - psutil.boot_time()
+        )
+    
+    async def collect_system_metrics(self, now: Optional[datetime] = None) -> SystemMetrics:
+        """Collect system performance metrics, stamped with `now` when given."""
+        try:
+            reader = self._read_proc if os.path.exists('/proc/stat') else self._read_psutil
+            cpu_usage, memory_usage, disk_usage, network_io, uptime = (
+                await asyncio.get_running_loop().run_in_executor(None, reader)
+            )
             
             metrics = SystemMetrics(
                 cpu_usage=cpu_usage,
@@ -111,10 +374,11 @@ class PerformanceMonitor:
                 disk_usage=disk_usage,
                 network_io=network_io,
                 uptime=uptime,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=now or datetime.now(timezone.utc)
             )
             
-            self.metrics_history.append(metrics)
+            self._append(cpu_usage, memory_usage, disk_usage, int(metrics.timestamp.timestamp() * 1000))
+            self.latest_metrics = metrics
             return metrics
             
         except Exception as e:
@@ -154,23 +418,76 @@ class PerformanceMonitor:
         
         return alerts
 
+    def check_performance_alerts_window(self, last_n: int = 100) -> List[Dict[str, Any]]:
+        """Back-check the last `last_n` samples; one alert per threshold crossing.
+        
+        A metric alerts on the sample where it first exceeds its threshold,
+        not on every sample that stays above it.
+        """
+        idx = self.tail_indices(last_n + 1)
+        if not len(idx):
+            return []
+        samples = np.column_stack((self.cpu[idx], self.mem[idx], self.disk[idx]))
+        
+        mask = samples > self._threshold_vec
+        newly = mask[1:] & ~mask[:-1]
+        if len(samples) <= last_n:
+            # No sample precedes the window, so a breach in its first row counts
+            newly = np.vstack((mask[:1], newly))
+        rows, cols = np.nonzero(newly)
+        offset = len(samples) - len(newly)
+        ts = self.ts[idx]
+        
+        names = ("cpu_usage", "memory_usage", "disk_usage")
+        labels = ("CPU", "memory", "disk")
+        levels = (AlertLevel.WARNING, AlertLevel.WARNING, AlertLevel.CRITICAL)
+        
+        alerts = []
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            value = float(samples[row + offset, col])
+            alerts.append({
+                "level": levels[col],
+                "component": "system",
+                "message": f"High {labels[col]} usage: {value:.1f}%",
+                "value": value,
+                "threshold": self.alert_thresholds[names[col]],
+                "timestamp": datetime.fromtimestamp(ts[row + offset] / 1000, timezone.utc).isoformat()
+            })
+        
+        return alerts
+
 class HealthChecker:
     """Component health checking."""
     
     def __init__(self):
         self.health_checks = {}
         self.health_history = deque(maxlen=100)
+        self.api_host = "127.0.0.1"
+        self.api_port = 8000
+    
+    async def _probe_api(self) -> int:
+        """GET /health over a bare connection and return the HTTP status code."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.api_host, self.api_port), timeout=2.0
+        )
+        try:
+            writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
     
-    async def check_database_health(self) -> HealthCheck:
+    async def check_database_health(self, now: Optional[datetime] = None) -> HealthCheck:
         """Check database health."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # This would check actual database connection
             # For now, simulate a health check
             await asyncio.sleep(0.1)  # Simulate DB check
             
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Simulate database status (replace with actual check)
             db_healthy = True  # This would be actual DB check
@@ -181,7 +498,7 @@ class HealthChecker:
                     status=HealthStatus.HEALTHY,
                     message="Database connection healthy",
                     response_time=response_time,
-                    timestamp=datetime.now(timezone.utc)
+                    timestamp=now or datetime.now(timezone.utc)
                 )
             else:
                 return HealthCheck(
@@ -189,29 +506,29 @@ class HealthChecker:
                     status=HealthStatus.UNHEALTHY,
                     message="Database connection failed",
                     response_time=response_time,
-                    timestamp=datetime.now(timezone.utc)
+                    timestamp=now or datetime.now(timezone.utc)
                 )
         
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             return HealthCheck(
                 component="database",
                 status=HealthStatus.CRITICAL,
                 message=f"Database health check error: {str(e)}",
                 response_time=response_time,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=now or datetime.now(timezone.utc)
             )
     
-    async def check_redis_health(self) -> HealthCheck:
+    async def check_redis_health(self, now: Optional[datetime] = None) -> HealthCheck:
         """Check Redis health."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # This would check actual Redis connection
             # For now, simulate a health check
             await asyncio.sleep(0.05)  # Simulate Redis check
             
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Simulate Redis status (replace with actual check)
             redis_healthy = True  # This would be actual Redis check
@@ -222,7 +539,7 @@ class HealthChecker:
                     status=HealthStatus.HEALTHY,
                     message="Redis connection healthy",
                     response_time=response_time,
-                    timestamp=datetime.now(timezone.utc)
+                    timestamp=now or datetime.now(timezone.utc)
                 )
             else:
                 return HealthCheck(
@@ -230,65 +547,65 @@ class HealthChecker:
                     status=HealthStatus.UNHEALTHY,
                     message="Redis connection failed",
                     response_time=response_time,
-                    timestamp=datetime.now(timezone.utc)
+                    timestamp=now or datetime.now(timezone.utc)
                 )
         
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             return HealthCheck(
                 component="redis",
                 status=HealthStatus.CRITICAL,
                 message=f"Redis health check error: {str(e)}",
                 response_time=response_time,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=now or datetime.now(timezone.utc)
             )
     
-    async def check_api_health(self) -> HealthCheck:
+    async def check_api_health(self, now: Optional[datetime] = None) -> HealthCheck:
         """Check API health."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Check if API is responding
-            async with aiohttp.ClientSession() as session:
-                async with session.get("http://localhost:8000/health", timeout=5) as response:
-                    response_time = time.time() - start_time
-                    
-                    if response.status == 200:
-                        return HealthCheck(
-                            component="api",
-                            status=HealthStatus.HEALTHY,
-                            message="API responding normally",
-                            response_time=response_time,
-                            timestamp=datetime.now(timezone.utc)
-                        )
-                    else:
-                        return HealthCheck(
-                            component="api",
-                            status=HealthStatus.DEGRADED,
-                            message=f"API returned status {response.status}",
-                            response_time=response_time,
-                            timestamp=datetime.now(timezone.utc)
-                        )
+            status = await self._probe_api()
+            response_time = time.monotonic() - start_time
+            
+            if status == 200:
+                return HealthCheck(
+                    component="api",
+                    status=HealthStatus.HEALTHY,
+                    message="API responding normally",
+                    response_time=response_time,
+                    timestamp=now or datetime.now(timezone.utc)
+                )
+            else:
+                return HealthCheck(
+                    component="api",
+                    status=HealthStatus.DEGRADED,
+                    message=f"API returned status {status}",
+                    response_time=response_time,
+                    timestamp=now or datetime.now(timezone.utc)
+                )
         
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             return HealthCheck(
                 component="api",
                 status=HealthStatus.CRITICAL,
                 message=f"API health check error: {str(e)}",
                 response_time=response_time,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=now or datetime.now(timezone.utc)
             )
     
-    async def run_all_health_checks(self) -> List[HealthCheck]:
-        """Run all health checks."""
+    async def run_all_health_checks(self, now: Optional[datetime] = None) -> List[HealthCheck]:
+        """Run all health checks, stamping results with `now` when given."""
         checks = []
+        now = now or datetime.now(timezone.utc)
         
         # Run health checks concurrently
         tasks = [
-            self.check_database_health(),
-            self.check_redis_health(),
-            self.check_api_health()
+            self.check_database_health(now),
+            self.check_redis_health(now),
+            self.check_api_health(now)
         ]
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -300,7 +617,7 @@ class HealthChecker:
                     status=HealthStatus.CRITICAL,
                     message=f"Health check failed: {str(result)}",
                     response_time=0.0,
-                    timestamp=datetime.now(timezone.utc)
+                    timestamp=now
                 ))
             else:
                 checks.append(result)
@@ -313,71 +630,180 @@ class HealthChecker:
 class AlertManager:
     """Alert management system."""
     
-    def __init__(self):
+    _LOG_LEVEL = {
+        AlertLevel.INFO: logging.INFO,
+        AlertLevel.WARNING: logging.WARNING,
+        AlertLevel.ERROR: logging.ERROR,
+        AlertLevel.CRITICAL: logging.CRITICAL
+    }
+    
+    _LEVELS = tuple(AlertLevel)
+    _LEVEL_INDEX = {level: i for i, level in enumerate(AlertLevel)}
+    _COUNT_SHARDS = 8
+    
+    def __init__(self, history_size: int = 1000):
         self.alert_callbacks = []
-        self.alert_history = deque(maxlen=1000)
-        self.alert_counts = defaultdict(int)
+        
+        # Per-level alert counts, sharded by producing task and summed on read
+        self._count_shards = [[0] * len(self._LEVELS) for _ in range(self._COUNT_SHARDS)]
+        
+        # Ring buffer of (level_idx, component_id, message, timestamp, details_json)
+        self.history_size = history_size
+        self.alert_history: List[Optional[tuple]] = [None] * history_size
+        self._history_idx = 0
+        self._history_count = 0
+        self._comp_intern: Dict[str, int] = {}
+        self._comp_names: List[str] = []
+        
+        # Repeat suppression: (component, key) -> (suppressed count, next emit time, backoff exponent)
+        self.suppress_base = 30.0  # seconds
+        self.suppress_max = 300.0  # seconds
+        self._suppress: Dict[tuple, tuple] = {}
+        self.suppressed_alerts = 0
+        
+        # Alert log lines are written by a single drainer task, off the caller's path
+        self._log_q: asyncio.Queue = asyncio.Queue(maxsize=10000)
+        self._log_drainer_task: Optional[asyncio.Task] = None
+        self.dropped_log_records = 0
+    
+    @property
+    def alert_counts(self) -> Dict[str, int]:
+        """Alert counts per level, for levels that have fired."""
+        counts = {}
+        for i, level in enumerate(self._LEVELS):
+            total = sum(shard[i] for shard in self._count_shards)
+            if total:
+                counts[level.value] = total
+        return counts
     
     def register_alert_callback(self, callback: Callable):
         """Register alert callback."""
         self.alert_callbacks.append(callback)
     
     async def send_alert(self, level: AlertLevel, component: str, message: str, 
-                        details: Dict[str, Any] = None):
-        """Send alert."""
+                        details: Dict[str, Any] = None, timestamp: Optional[str] = None,
+                        key: Optional[str] = None):
+        """Send alert (`timestamp` is a preformatted ISO string, default now).
+        
+        Repeats of the same (component, key) are suppressed with exponential
+        backoff until `resolve` is called; `key` defaults to the message text
+        before the first colon.
+        """
+        suppress_key = (component, key or message.split(":", 1)[0])
+        now = time.monotonic()
+        state = self._suppress.get(suppress_key)
+        if state is not None:
+            count, next_emit, exp = state
+            if now < next_emit:
+                self._suppress[suppress_key] = (count + 1, next_emit, exp)
+                self.suppressed_alerts += 1
+                return
+            if count:
+                message = f"{message} (still breaching, {count + 1} occurrences)"
+            exp += 1
+        else:
+            exp = 0
+        self._suppress[suppress_key] = (0, now + min(self.suppress_max, self.suppress_base * 2 ** exp), exp)
+        
         alert = {
             "level": level.value,
             "component": component,
             "message": message,
             "details": details or {},
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat()
         }
         
         # Store in history
-        self.alert_history.append(alert)
-        
-        # Update alert counts
-        self.alert_counts[level.value] += 1
+        comp_id = self._comp_intern.get(component)
+        if comp_id is None:
+            comp_id = self._comp_intern[component] = len(self._comp_names)
+            self._comp_names.append(component)
+        self.alert_history[self._history_idx % self.history_size] = (
+            self._LEVEL_INDEX[level], comp_id, message, alert["timestamp"], orjson.dumps(alert["details"], default=str)
+        )
+        self._history_idx += 1
+        self._history_count = min(self._history_count + 1, self.history_size)
         
-        # Log alert
-        log_level = {
-            AlertLevel.INFO: logger.info,
-            AlertLevel.WARNING: logger.warning,
-            AlertLevel.ERROR: logger.error,
-            AlertLevel.CRITICAL: logger.critical
-        }
+        # Update alert counts (object ids are 16-byte aligned, so drop the low bits)
+        shard = self._count_shards[(id(asyncio.current_task()) >> 4) & (self._COUNT_SHARDS - 1)]
+        shard[self._LEVEL_INDEX[level]] += 1
         
-        log_level[level](f"Alert [{level.value}] {component}: {message}")
+        # Log alert (queued; dropped and counted if the drainer falls behind)
+        if self._log_drainer_task is None or self._log_drainer_task.done():
+            self._log_drainer_task = asyncio.create_task(self._drain_logs())
+        try:
+            self._log_q.put_nowait((level, component, message))
+        except asyncio.QueueFull:
+            self.dropped_log_records += 1
         
-        # Execute callbacks
-        for callback in self.alert_callbacks:
-            try:
-                await callback(alert)
-            except Exception as e:
-                logger.error(f"Alert callback error: {e}")
+        # Execute callbacks concurrently
+        results = await asyncio.gather(
+            *(callback(alert) for callback in self.alert_callbacks), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Alert callback error: {result}")
     
-    def get_alert_summary(self) -> Dict[str, Any]:
+    async def _drain_logs(self):
+        """Write queued alert log records, up to 256 per wakeup."""
+        while True:
+            batch = [await self._log_q.get()]
+            while len(batch) < 256 and not self._log_q.empty():
+                batch.append(self._log_q.get_nowait())
+            
+            for level, component, message in batch:
+                logger.log(self._LOG_LEVEL[level], "Alert [%s] %s: %s", level.value, component, message)
+    
+    def resolve(self, component: str, keep: Optional[set] = None):
+        """Clear repeat suppression for `component` (except keys in `keep`) once it recovers."""
+        for suppress_key in [k for k in self._suppress if k[0] == component and k[1] not in (keep or ())]:
+            del self._suppress[suppress_key]
+    
+    def recent_alerts(self, last_n: int = 10) -> List[Dict[str, Any]]:
+        """Rebuild the last `last_n` alerts (oldest first) as dicts."""
+        alerts = []
+        for i in range(self._history_idx - min(last_n, self._history_count), self._history_idx):
+            level_idx, comp_id, message, timestamp, details = self.alert_history[i % self.history_size]
+            alerts.append({
+                "level": self._LEVELS[level_idx].value,
+                "component": self._comp_names[comp_id],
+                "message": message,
+                "details": orjson.loads(details),
+                "timestamp": timestamp
+            })
+        return alerts
+    
+    def get_alert_summary(self, timestamp: Optional[str] = None) -> AlertSummaryResp:
         """Get alert summary."""
-        return {
-            "total_alerts": len(self.alert_history),
-            "alert_counts": dict(self.alert_counts),
-            "recent_alerts": list(self.alert_history)[-10:],  # Last 10 alerts
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        return AlertSummaryResp(
+            total_alerts=self._history_count,
+            alert_counts=self.alert_counts,
+            recent_alerts=self.recent_alerts(10),  # Last 10 alerts
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat()
+        )
 
 class MonitoringSystem:
     """Production monitoring system."""
     
-    def __init__(self):
+    def __init__(self, redis_url: str = "redis://localhost:6379"):
         self.performance_monitor = PerformanceMonitor()
         self.health_checker = HealthChecker()
         self.alert_manager = AlertManager()
         self.monitoring_task = None
         self.running = False
         
+        # Metrics/health/alert history is mirrored to Redis, one pipeline per tick
+        self.redis = redis.from_url(redis_url)
+        self.history_size = 1000
+        self._pending_metrics: List[SystemMetrics] = []
+        self._pending_health: List[HealthCheck] = []
+        self._pending_alerts: List[Dict[str, Any]] = []
+        self._stop_event: Optional[asyncio.Event] = None
+        
         # Monitoring intervals
         self.system_metrics_interval = 30  # seconds
         self.health_check_interval = 60    # seconds
+        self.flush_interval = 5            # seconds
         
         # Register alert callbacks
         self.alert_manager.register_alert_callback(self._log_alert)
@@ -386,76 +812,186 @@ class MonitoringSystem:
     async def start_monitoring(self):
         """Start monitoring system."""
         self.running = True
-        self.monitoring_task = asyncio.create_task(self._monitoring_loop())
+        self._stop_event = asyncio.Event()
+        self.monitoring_task = asyncio.create_task(self._run_loops())
         logger.info("Monitoring system started")
     
     async def stop_monitoring(self):
         """Stop monitoring system."""
         self.running = False
+        if self._stop_event:
+            self._stop_event.set()
         if self.monitoring_task:
-            self.monitoring_task.cancel()
+            # Loops exit at their next wait; give the final flush a chance to run
+            try:
+                await asyncio.wait_for(self.monitoring_task, timeout=10)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+            except Exception as e:
+                logger.error(f"Monitoring shutdown error: {e}")
+        self.performance_monitor.close()
         logger.info("Monitoring system stopped")
     
-    async def _monitoring_loop(self):
-        """Main monitoring loop."""
-        last_health_check = 0
-        
+    async def _run_loops(self):
+        """Run metrics, health-check and flush loops side by side, each on its own cadence."""
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._metrics_loop())
+            tg.create_task(self._health_loop())
+            tg.create_task(self._alert_flush_loop())
+    
+    async def _wait(self, interval: float) -> bool:
+        """Sleep for `interval` seconds; return True if monitoring was stopped meanwhile."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _wait_until(self, deadline_ns: int) -> bool:
+        """`_wait` until a `time.monotonic_ns()` deadline."""
+        return await self._wait(max(0, deadline_ns - time.monotonic_ns()) / 1e9)
+    
+    @staticmethod
+    def _next_deadline(deadline_ns: int, interval: float) -> int:
+        """Advance a cadence deadline, skipping ticks missed while stalled."""
+        return max(deadline_ns + int(interval * 1_000_000_000), time.monotonic_ns())
+    
+    async def _metrics_loop(self):
+        """Collect system metrics every `system_metrics_interval` seconds."""
+        deadline_ns = time.monotonic_ns()
         while self.running:
+            interval = self.system_metrics_interval
             try:
-                current_time = time.time()
+                # One wall-clock timestamp (and its ISO form) for everything this tick
+                now = datetime.now(timezone.utc)
+                now_iso = now.isoformat()
                 
                 # Collect system metrics
-                system_metrics = await self.performance_monitor.collect_system_metrics()
+                system_metrics = await self.performance_monitor.collect_system_metrics(now)
                 if system_metrics:
+                    self._pending_metrics.append(system_metrics)
+                    
                     # Check for performance alerts
                     alerts = self.performance_monitor.check_performance_alerts(system_metrics)
+                    self.alert_manager.resolve(
+                        "system", keep={alert["message"].split(":", 1)[0] for alert in alerts}
+                    )
                     for alert in alerts:
                         await self.alert_manager.send_alert(
                             alert["level"],
                             alert["component"],
                             alert["message"],
-                            {"value": alert["value"], "threshold": alert["threshold"]}
+                            {"value": alert["value"], "threshold": alert["threshold"]},
+                            now_iso
                         )
+            except Exception as e:
+                logger.error(f"Monitoring loop error: {e}")
+                interval = 10
+            
+            deadline_ns = self._next_deadline(deadline_ns, interval)
+            if await self._wait_until(deadline_ns):
+                break
+    
+    async def _health_loop(self):
+        """Run health checks every `health_check_interval` seconds."""
+        deadline_ns = time.monotonic_ns()
+        while self.running:
+            interval = self.health_check_interval
+            try:
+                now = datetime.now(timezone.utc)
+                now_iso = now.isoformat()
                 
-                # Run health checks periodically
-                if current_time - last_health_check >= self.health_check_interval:
-                    health_checks = await self.health_checker.run_all_health_checks()
-                    
-                    for check in health_checks:
-                        if check.status == HealthStatus.CRITICAL:
-                            await self.alert_manager.send_alert(
-                                AlertLevel.CRITICAL,
-                                check.component,
-                                check.message,
-                                {"response_time": check.response_time}
-                            )
-                        elif check.status == HealthStatus.UNHEALTHY:
-                            await self.alert_manager.send_alert(
-                                AlertLevel.ERROR,
-                                check.component,
-                                check.message,
-                                {"response_time": check.response_time}
-                            )
-                        elif check.status == HealthStatus.DEGRADED:
-                            await self.alert_manager.send_alert(
-                                AlertLevel.WARNING,
-                                check.component,
-                                check.message,
-                                {"response_time": check.response_time}
-                            )
-                    
-                    last_health_check = current_time
-                
-                # Sleep for monitoring interval
-                await asyncio.sleep(self.system_metrics_interval)
+                health_checks = await self.health_checker.run_all_health_checks(now)
+                self._pending_health.extend(health_checks)
                 
+                for check in health_checks:
+                    if check.status == HealthStatus.HEALTHY:
+                        self.alert_manager.resolve(check.component)
+                    elif check.status == HealthStatus.CRITICAL:
+                        await self.alert_manager.send_alert(
+                            AlertLevel.CRITICAL,
+                            check.component,
+                            check.message,
+                            {"response_time": check.response_time},
+                            now_iso
+                        )
+                    elif check.status == HealthStatus.UNHEALTHY:
+                        await self.alert_manager.send_alert(
+                            AlertLevel.ERROR,
+                            check.component,
+                            check.message,
+                            {"response_time": check.response_time},
+                            now_iso
+                        )
+                    elif check.status == HealthStatus.DEGRADED:
+                        await self.alert_manager.send_alert(
+                            AlertLevel.WARNING,
+                            check.component,
+                            check.message,
+                            {"response_time": check.response_time},
+                            now_iso
+                        )
             except Exception as e:
-                logger.error(f"Monitoring loop error: {e}")
-                await asyncio.sleep(10)
+                logger.error(f"Health check loop error: {e}")
+                interval = 10
+            
+            deadline_ns = self._next_deadline(deadline_ns, interval)
+            if await self._wait_until(deadline_ns):
+                break
+    
+    async def _alert_flush_loop(self):
+        """Flush buffered metrics, health checks and alerts to Redis every `flush_interval` seconds."""
+        while self.running:
+            stopped = await self._wait(self.flush_interval)
+            await self._flush_pending()
+            if stopped:
+                break
+    
+    async def _flush_pending(self):
+        """Write buffered metrics, health checks and alerts in one Redis round trip."""
+        metrics, self._pending_metrics = self._pending_metrics, []
+        health_checks, self._pending_health = self._pending_health, []
+        alerts, self._pending_alerts = self._pending_alerts, []
+        if not metrics and not health_checks and not alerts:
+            return
+        
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for sample in metrics:
+                    ts = sample.timestamp.timestamp()
+                    for key, value in (("metrics:cpu", sample.cpu_usage),
+                                       ("metrics:mem", sample.memory_usage),
+                                       ("metrics:disk", sample.disk_usage)):
+                        pipe.zadd(key, {f"{ts}:{value}": ts})
+                if metrics:
+                    for key in ("metrics:cpu", "metrics:mem", "metrics:disk"):
+                        pipe.zremrangebyrank(key, 0, -self.history_size - 1)
+                
+                for check in health_checks:
+                    pipe.hset(f"health:{check.component}", mapping={
+                        "status": check.status.value,
+                        "message": check.message,
+                        "response_time": check.response_time,
+                        "timestamp": check._timestamp_iso
+                    })
+                
+                for alert in alerts:
+                    pipe.xadd("alerts", {
+                        "level": alert["level"],
+                        "component": alert["component"],
+                        "message": alert["message"],
+                        "details": orjson.dumps(alert["details"], default=str),
+                        "timestamp": alert["timestamp"]
+                    }, maxlen=self.history_size, approximate=True)
+                
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error persisting monitoring data: {e}")
     
     async def _log_alert(self, alert: Dict[str, Any]):
         """Log alert to file."""
-        # This would write to a log file or database
+        # Buffered; written to Redis by _alert_flush_loop
+        self._pending_alerts.append(alert)
         logger.info(f"Alert logged: {alert}")
     
     async def _send_notification(self, alert: Dict[str, Any]):
@@ -464,13 +1000,15 @@ class MonitoringSystem:
         if alert["level"] in ["error", "critical"]:
             logger.warning(f"Notification sent: {alert}")
     
-    def get_system_status(self) -> Dict[str, Any]:
+    def get_system_status(self) -> SystemStatusResp:
         """Get overall system status."""
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
         # Get latest health checks
         latest_health_checks = list(self.health_checker.health_history)[-10:]
         
         # Get latest system metrics
-        latest_metrics = list(self.performance_monitor.metrics_history)[-1] if self.performance_monitor.metrics_history else None
+        latest_metrics = self.performance_monitor.latest_metrics
         
         # Determine overall status
         overall_status = HealthStatus.HEALTHY
@@ -481,68 +1019,70 @@ class MonitoringSystem:
         elif any(check.status == HealthStatus.DEGRADED for check in latest_health_checks):
             overall_status = HealthStatus.DEGRADED
         
-        return {
-            "status": overall_status.value,
-            "running": self.running,
-            "uptime": latest_metrics.uptime if latest_metrics else 0,
-            "system_metrics": {
-                "cpu_usage": latest_metrics.cpu_usage if latest_metrics else 0,
-                "memory_usage": latest_metrics.memory_usage if latest_metrics else 0,
-                "disk_usage": latest_metrics.disk_usage if latest_metrics else 0
-            },
-            "health_checks": [
-                {
-                    "component": check.component,
-                    "status": check.status.value,
-                    "message": check.message,
-                    "response_time": check.response_time,
-                    "timestamp": check.timestamp.isoformat()
-                }
+        return SystemStatusResp(
+            status=overall_status.value,
+            running=self.running,
+            uptime=latest_metrics.uptime if latest_metrics else 0.0,
+            system_metrics=SysMetricsResp(
+                cpu_usage=latest_metrics.cpu_usage if latest_metrics else 0.0,
+                memory_usage=latest_metrics.memory_usage if latest_metrics else 0.0,
+                disk_usage=latest_metrics.disk_usage if latest_metrics else 0.0
+            ),
+            health_checks=[
+                HealthCheckResp(
+                    component=check.component,
+                    status=check.status.value,
+                    message=check.message,
+                    response_time=check.response_time,
+                    timestamp=check._timestamp_iso
+                )
                 for check in latest_health_checks
             ],
-            "alerts": self.alert_manager.get_alert_summary(),
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+            alerts=self.alert_manager.get_alert_summary(now_iso),
+            timestamp=now_iso
+        )
+    
+    def to_json(self) -> bytes:
+        """System status serialized to JSON bytes."""
+        return _json_encoder.encode(self.get_system_status())
     
-    def get_performance_metrics(self) -> Dict[str, Any]:
+    def get_performance_metrics(self) -> PerformanceMetricsResp:
         """Get performance metrics."""
-        if not self.performance_monitor.metrics_history:
-            return {"error": "No metrics available"}
+        monitor = self.performance_monitor
+        latest = monitor.latest_metrics
+        if latest is None:
+            return PerformanceMetricsResp(error="No metrics available")
         
-        metrics = list(self.performance_monitor.metrics_history)
+        n = monitor.count
+        aggregates = monitor.aggregates
         
-        return {
-            "current": {
-                "cpu_usage": metrics[-1].cpu_usage,
-                "memory_usage": metrics[-1].memory_usage,
-                "disk_usage": metrics[-1].disk_usage,
-                "uptime": metrics[-1].uptime
-            },
-            "average": {
-                "cpu_usage": sum(m.cpu_usage for m in metrics) / len(metrics),
-                "memory_usage": sum(m.memory_usage for m in metrics) / len(metrics),
-                "disk_usage": sum(m.disk_usage for m in metrics) / len(metrics)
-            },
-            "max": {
-                "cpu_usage": max(m.cpu_usage for m in metrics),
-                "memory_usage": max(m.memory_usage for m in metrics),
-                "disk_usage": max(m.disk_usage for m in metrics)
-            },
-            "min": {
-                "cpu_usage": min(m.cpu_usage for m in metrics),
-                "memory_usage": min(m.memory_usage for m in metrics),
-                "disk_usage": min(m.disk_usage for m in metrics)
-            },
-            "history": [
-                {
-                    "timestamp": m.timestamp.isoformat(),
-                    "cpu_usage": m.cpu_usage,
-                    "memory_usage": m.memory_usage,
-                    "disk_usage": m.disk_usage
-                }
-                for m in metrics[-50:]  # Last 50 metrics
+        # Last 50 metrics, oldest first: one gather per field, one conversion pass
+        idx = monitor.tail_indices(50)
+        ts = (monitor.ts[idx] / 1000).tolist()
+        cpu_hist = monitor.cpu[idx].tolist()
+        mem_hist = monitor.mem[idx].tolist()
+        disk_hist = monitor.disk[idx].tolist()
+        
+        return PerformanceMetricsResp(
+            current=CurrentMetricsResp(
+                cpu_usage=latest.cpu_usage,
+                memory_usage=latest.memory_usage,
+                disk_usage=latest.disk_usage,
+                uptime=latest.uptime
+            ),
+            average={name: aggs[0].query() / n for name, aggs in aggregates.items()},
+            max={name: aggs[2].query() for name, aggs in aggregates.items()},
+            min={name: aggs[1].query() for name, aggs in aggregates.items()},
+            history=[
+                MetricSampleResp(
+                    timestamp=datetime.fromtimestamp(t, timezone.utc).isoformat(),
+                    cpu_usage=cpu,
+                    memory_usage=mem,
+                    disk_usage=disk
+                )
+                for t, cpu, mem, disk in zip(ts, cpu_hist, mem_hist, disk_hist)
             ]
-        }
+        )
 
 # Global instance
 monitoring_system = MonitoringSystem()
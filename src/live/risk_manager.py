@@ -5,17 +5,27 @@ Real-time risk monitoring, position tracking, and emergency controls.
 
 import asyncio
 import logging
+import time
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 import numpy as np
 import pandas as pd
-from collections import defaultdict
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from itertools import islice
 import json
 
 logger = logging.getLogger(__name__)
 
+RETURNS_LOOKBACK_DAYS = 252  # Trading days of daily returns kept for risk metrics
+MONITOR_MAX_INTERVAL = 5.0  # seconds between risk checks when nothing changes
+MONITOR_DEBOUNCE = 0.05  # seconds to coalesce bursts of position updates
+CLOSE_CONCURRENCY = 10  # Emergency closes in flight at once
+DAILY_PNL_DAYS = 32  # Slots in the daily P&L ring (indexed by UTC day % size)
+HISTORY_MAXLEN = 100_000  # Positions / closed trades kept in tracker history
+
 class RiskLevel(Enum):
     """Risk levels for alerts."""
     LOW = "low"
@@ -28,7 +38,7 @@ class PositionSide(Enum):
     LONG = "long"
     SHORT = "short"
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position information."""
     symbol: str
@@ -42,8 +52,12 @@ class Position:
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    sign: float = field(default=0.0, init=False, repr=False)  # +1 long, -1 short
+    
+    def __post_init__(self):
+        self.sign = 1.0 if self.side == PositionSide.LONG else -1.0
 
-@dataclass
+@dataclass(slots=True)
 class RiskMetrics:
     """Risk metrics for portfolio."""
     total_pnl: float
@@ -60,6 +74,8 @@ class RiskMetrics:
     correlation: float
     timestamp: datetime
 
+RISK_METRIC_FIELDS = tuple(f.name for f in fields(RiskMetrics))
+
 class RiskLimits:
     """Risk limits configuration."""
     
@@ -105,12 +121,13 @@ class EmergencyStop:
             
             logger.critical(f"EMERGENCY STOP TRIGGERED: {reason}")
             
-            # Execute callbacks
-            for callback in self.callbacks:
-                try:
-                    await callback(reason)
-                except Exception as e:
-                    logger.error(f"Emergency stop callback error: {e}")
+            # Execute callbacks concurrently
+            results = await asyncio.gather(
+                *(callback(reason) for callback in self.callbacks), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Emergency stop callback error: {result}")
     
     def reset(self):
         """Reset emergency stop."""
@@ -124,37 +141,118 @@ class PositionTracker:
     
     def __init__(self):
         self.positions: Dict[str, Position] = {}
-        self.position_history: List[Position] = []
-        self.pnl_history: List[Dict[str, Any]] = []
+        # Bounded history; P&L totals live in the running sums, not in these records
+        self.position_history: deque = deque(maxlen=HISTORY_MAXLEN)
+        self.pnl_history: deque = deque(maxlen=HISTORY_MAXLEN)
+        
+        # Running totals, kept in step with positions so reads are O(1)
+        self._realized_pnl_sum = 0.0
+        self._unrealized_pnl_sum = 0.0
+        self._exposure_sum = 0.0
+        
+        # Open positions as parallel columns (symbol -> slot); free slots hold size 0
+        self._capacity = 64
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = list(range(self._capacity - 1, -1, -1))
+        self._sides = np.zeros(self._capacity, np.int8)
+        self._sizes = np.zeros(self._capacity, np.float64)
+        self._entry_prices = np.zeros(self._capacity, np.float64)
+        self._current_prices = np.zeros(self._capacity, np.float64)
+    
+    def _grow(self):
+        """Double column capacity."""
+        old = self._capacity
+        self._capacity = old * 2
+        self._sides = np.concatenate([self._sides, np.zeros(old, np.int8)])
+        self._sizes = np.concatenate([self._sizes, np.zeros(old, np.float64)])
+        self._entry_prices = np.concatenate([self._entry_prices, np.zeros(old, np.float64)])
+        self._current_prices = np.concatenate([self._current_prices, np.zeros(old, np.float64)])
+        self._free_slots.extend(range(self._capacity - 1, old - 1, -1))
+    
+    def recompute_totals(self):
+        """Recompute unrealized P&L and exposure from the columns, discarding accumulated drift."""
+        sizes = self._sizes
+        current = self._current_prices
+        self._unrealized_pnl_sum = float(np.sum(self._sides * (current - self._entry_prices) * sizes))
+        self._exposure_sum = float(np.abs(sizes * current).sum())
     
     def add_position(self, position: Position):
         """Add new position."""
+        replaced = self.positions.get(position.symbol)
+        if replaced is not None:
+            self._unrealized_pnl_sum -= replaced.unrealized_pnl
+            self._exposure_sum -= abs(replaced.size * replaced.current_price)
+            slot = self._slots[position.symbol]
+        else:
+            if not self._free_slots:
+                self._grow()
+            slot = self._slots[position.symbol] = self._free_slots.pop()
+        sign = position.sign
+        self._sides[slot] = sign
+        self._sizes[slot] = position.size
+        self._entry_prices[slot] = position.entry_price
+        self._current_prices[slot] = position.current_price
+        # Unrealized P&L is derived from prices, as in update_position
+        position.unrealized_pnl = sign * (position.current_price - position.entry_price) * position.size
         self.positions[position.symbol] = position
         self.position_history.append(position)
+        self._realized_pnl_sum += position.realized_pnl
+        self._unrealized_pnl_sum += position.unrealized_pnl
+        self._exposure_sum += abs(position.size * position.current_price)
         logger.info(f"Added position: {position.symbol} {position.side.value} {position.size}")
     
     def update_position(self, symbol: str, current_price: float):
         """Update position with current price."""
         if symbol in self.positions:
             position = self.positions[symbol]
+            self._exposure_sum += abs(position.size * current_price) - abs(position.size * position.current_price)
+            self._current_prices[self._slots[symbol]] = current_price
             position.current_price = current_price
             
             # Calculate unrealized P&L
-            if position.side == PositionSide.LONG:
-                position.unrealized_pnl = (current_price - position.entry_price) * position.size
-            else:
-                position.unrealized_pnl = (position.entry_price - current_price) * position.size
+            unrealized_pnl = position.sign * (current_price - position.entry_price) * position.size
+            self._unrealized_pnl_sum += unrealized_pnl - position.unrealized_pnl
+            position.unrealized_pnl = unrealized_pnl
+    
+    def update_positions(self, prices: Dict[str, float]) -> List[str]:
+        """Update several positions' prices at once; returns the symbols that were updated."""
+        slots = self._slots
+        symbols = [symbol for symbol in prices if symbol in slots]
+        if not symbols:
+            return symbols
+        
+        idx = np.fromiter((slots[symbol] for symbol in symbols), np.int64, len(symbols))
+        new_prices = np.fromiter((prices[symbol] for symbol in symbols), np.float64, len(symbols))
+        sizes = self._sizes[idx]
+        signs = self._sides[idx]
+        entry = self._entry_prices[idx]
+        old_prices = self._current_prices[idx]
+        self._current_prices[idx] = new_prices
+        
+        # Vector deltas for the running sums
+        unrealized = signs * (new_prices - entry) * sizes
+        self._unrealized_pnl_sum += float(unrealized.sum() - (signs * (old_prices - entry) * sizes).sum())
+        self._exposure_sum += float(np.abs(sizes * new_prices).sum() - np.abs(sizes * old_prices).sum())
+        
+        # Keep Position objects in step for consumers
+        positions = self.positions
+        for symbol, price, pnl in zip(symbols, new_prices.tolist(), unrealized.tolist()):
+            position = positions[symbol]
+            position.current_price = price
+            position.unrealized_pnl = pnl
+        return symbols
     
     def close_position(self, symbol: str, exit_price: float, exit_time: datetime):
         """Close position."""
         if symbol in self.positions:
             position = self.positions[symbol]
+            self._realized_pnl_sum -= position.realized_pnl
+            self._unrealized_pnl_sum -= position.unrealized_pnl
+            self._exposure_sum -= abs(position.size * position.current_price)
             
             # Calculate realized P&L
-            if position.side == PositionSide.LONG:
-                position.realized_pnl = (exit_price - position.entry_price) * position.size
-            else:
-                position.realized_pnl = (position.entry_price - exit_price) * position.size
+            position.realized_pnl = position.sign * (exit_price - position.entry_price) * position.size
+            self._realized_pnl_sum += position.realized_pnl
             
             # Record P&L history
             self.pnl_history.append({
@@ -171,46 +269,62 @@ class PositionTracker:
             
             # Remove from active positions
             del self.positions[symbol]
+            slot = self._slots.pop(symbol)
+            self._sizes[slot] = 0.0
+            self._free_slots.append(slot)
             logger.info(f"Closed position: {symbol}, P&L: {position.realized_pnl}")
     
     def get_total_exposure(self) -> float:
         """Get total portfolio exposure."""
-        return sum(abs(pos.size * pos.current_price) for pos in self.positions.values())
+        return self._exposure_sum
     
     def get_total_pnl(self) -> float:
         """Get total P&L (realized + unrealized)."""
-        realized = sum(pos.realized_pnl for pos in self.position_history)
-        unrealized = sum(pos.unrealized_pnl for pos in self.positions.values())
-        return realized + unrealized
+        return self._realized_pnl_sum + self._unrealized_pnl_sum
     
     def get_unrealized_pnl(self) -> float:
         """Get unrealized P&L."""
-        return sum(pos.unrealized_pnl for pos in self.positions.values())
+        return self._unrealized_pnl_sum
     
     def get_realized_pnl(self) -> float:
         """Get realized P&L."""
-        return sum(pos.realized_pnl for pos in self.position_history)
+        return self._realized_pnl_sum
 
 class RiskManager:
     """Production risk management system."""
     
     def __init__(self, initial_capital: float = 100000.0):
         self.initial_capital = initial_capital
-        self.current_capital = initial_capital
+        self._cap = initial_capital
         self.limits = RiskLimits()
         self.position_tracker = PositionTracker()
         self.emergency_stop = EmergencyStop(self)
         self.risk_metrics = None
+        self._metrics_view: Dict[str, Any] = dict.fromkeys(RISK_METRIC_FIELDS, 0.0)  # Updated in place, shared by alerts
         self.alert_callbacks = []
         self.monitoring_task = None
         self.running = False
+        self._dirty = asyncio.Event()  # Set when positions change
         
         # Performance tracking
-        self.daily_pnl = defaultdict(float)
+        self._daily_pnl_arr = np.zeros(DAILY_PNL_DAYS, np.float64)
+        self._today_epoch_day = -1
+        self._today_idx = 0
         self.max_equity = initial_capital
         self.current_drawdown = 0.0
         self.max_drawdown = 0.0
         
+        # Daily returns ring, slot = day ordinal % lookback; -1 marks an empty slot
+        self._daily_returns = np.zeros(RETURNS_LOOKBACK_DAYS, np.float64)
+        self._return_days = np.full(RETURNS_LOOKBACK_DAYS, -1, np.int64)
+        self._day_head = -1  # Latest day ordinal recorded
+        
+        # Welford mean / M2 and sorted order over the daily returns in the window
+        self._ret_n = 0
+        self._ret_mean = 0.0
+        self._ret_m2 = 0.0
+        self._sorted_returns: List[float] = []
+        
         # Register emergency stop callbacks
         self.emergency_stop.register_callback(self.close_all_positions)
         self.emergency_stop.register_callback(self.notify_emergency)
@@ -218,6 +332,7 @@ class RiskManager:
     async def start_monitoring(self):
         """Start real-time risk monitoring."""
         self.running = True
+        self._dirty.set()  # First pass runs immediately
         self.monitoring_task = asyncio.create_task(self._monitor_loop())
         logger.info("Risk monitoring started")
     
@@ -232,44 +347,46 @@ class RiskManager:
         """Main monitoring loop."""
         while self.running:
             try:
+                # Wait for a position change (or the heartbeat), then let a burst of updates settle
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=MONITOR_MAX_INTERVAL)
+                    await asyncio.sleep(MONITOR_DEBOUNCE)
+                except asyncio.TimeoutError:
+                    pass
+                self._dirty.clear()
+                now = datetime.now(timezone.utc)  # One clock read per tick
+                
                 # Update risk metrics
-                await self.update_risk_metrics()
+                await self.update_risk_metrics(now)
                 
                 # Check risk limits
-                await self.check_risk_limits()
-                
-                # Update drawdown
-                self._update_drawdown()
-                
-                # Sleep for monitoring interval
-                await asyncio.sleep(1)  # 1 second monitoring interval
+                await self.check_risk_limits(now)
                 
             except Exception as e:
                 logger.error(f"Risk monitoring error: {e}")
                 await asyncio.sleep(5)
     
-    async def update_risk_metrics(self):
+    async def update_risk_metrics(self, now: Optional[datetime] = None):
         """Update risk metrics."""
         try:
             # Calculate basic metrics
+            self.position_tracker.recompute_totals()
             total_pnl = self.position_tracker.get_total_pnl()
             unrealized_pnl = self.position_tracker.get_unrealized_pnl()
             realized_pnl = self.position_tracker.get_realized_pnl()
             total_exposure = self.position_tracker.get_total_exposure()
             
-            # Calculate returns for risk metrics
-            returns = self._calculate_returns()
-            
-            if len(returns) > 0:
-                # Calculate risk metrics
-                volatility = np.std(returns) * np.sqrt(252)  # Annualized
-                var_95 = np.percentile(returns, 5)
-                cvar_95 = returns[returns <= var_95].mean() if len(returns[returns <= var_95]) > 0 else 0
+            if self._ret_n > 0 and len(self.position_tracker.pnl_history) >= 2:
+                # Volatility (annualized) and Sharpe from the running moments
+                std = np.sqrt(self._ret_m2 / self._ret_n)
+                volatility = std * np.sqrt(252)
                 
-                # Calculate Sharpe ratio (assuming risk-free rate of 2%)
+                # Sharpe ratio (assuming risk-free rate of 2%); excess returns share the std
                 risk_free_rate = 0.02 / 252  # Daily risk-free rate
-                excess_returns = returns - risk_free_rate
-                sharpe_ratio = np.mean(excess_returns) / np.std(excess_returns) if np.std(excess_returns) > 0 else 0
+                sharpe_ratio = (self._ret_mean - risk_free_rate) / std if std > 0 else 0
+                
+                # VaR/CVaR from the sorted window
+                var_95, cvar_95 = self._tail_risk()
                 
                 # Calculate beta (simplified - would need market data)
                 beta = 1.0  # Placeholder
@@ -296,16 +413,23 @@ class RiskManager:
                 volatility=volatility,
                 beta=beta,
                 correlation=correlation,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=now or datetime.now(timezone.utc)
             )
             
+            # Refresh the alert view in place rather than building a dict per alert
+            view = self._metrics_view
+            for name in RISK_METRIC_FIELDS:
+                view[name] = getattr(self.risk_metrics, name)
+            view["timestamp"] = self.risk_metrics.timestamp.isoformat()
+            
         except Exception as e:
             logger.error(f"Error updating risk metrics: {e}")
     
-    async def check_risk_limits(self):
+    async def check_risk_limits(self, now: Optional[datetime] = None):
         """Check all risk limits."""
         if not self.risk_metrics:
             return
+        now = now or datetime.now(timezone.utc)
         
         # Check drawdown limit
         if self.current_drawdown > self.limits.max_drawdown:
@@ -313,8 +437,7 @@ class RiskManager:
             return
         
         # Check daily loss limit
-        today = datetime.now(timezone.utc).date()
-        daily_pnl = self.daily_pnl.get(today, 0)
+        daily_pnl = self._daily_pnl_arr[self._roll_day(now.timestamp())]
         daily_loss_pct = abs(daily_pnl) / self.initial_capital if daily_pnl < 0 else 0
         
         if daily_loss_pct > self.limits.max_daily_loss:
@@ -323,63 +446,122 @@ class RiskManager:
         
         # Check VaR limit
         if abs(self.risk_metrics.var_95) > self.limits.max_var:
-            await self._send_alert(RiskLevel.HIGH, f"VaR limit exceeded: {self.risk_metrics.var_95:.2%}")
+            await self._send_alert(RiskLevel.HIGH, f"VaR limit exceeded: {self.risk_metrics.var_95:.2%}", now)
         
         # Check volatility limit
         if self.risk_metrics.volatility > self.limits.max_volatility:
-            await self._send_alert(RiskLevel.MEDIUM, f"High volatility: {self.risk_metrics.volatility:.2%}")
+            await self._send_alert(RiskLevel.MEDIUM, f"High volatility: {self.risk_metrics.volatility:.2%}", now)
         
         # Check Sharpe ratio
         if self.risk_metrics.sharpe_ratio < self.limits.min_sharpe:
-            await self._send_alert(RiskLevel.MEDIUM, f"Low Sharpe ratio: {self.risk_metrics.sharpe_ratio:.2f}")
+            await self._send_alert(RiskLevel.MEDIUM, f"Low Sharpe ratio: {self.risk_metrics.sharpe_ratio:.2f}", now)
     
-    def _update_drawdown(self):
-        """Update drawdown calculations."""
-        if self.current_capital > self.max_equity:
-            self.max_equity = self.current_capital
+    def _roll_day(self, now_ts: Optional[float] = None) -> int:
+        """Slot of today's P&L, clearing it when the UTC date rolls over."""
+        day = int((time.time() if now_ts is None else now_ts) // 86400)
+        if day != self._today_epoch_day:
+            self._today_epoch_day = day
+            self._today_idx = day % DAILY_PNL_DAYS
+            self._daily_pnl_arr[self._today_idx] = 0.0
+        return self._today_idx
+    
+    @property
+    def current_capital(self) -> float:
+        """Current capital (initial capital plus total P&L)."""
+        return self._cap
+    
+    @current_capital.setter
+    def current_capital(self, value: float):
+        # Drawdown tracks the running equity peak, updated only when capital changes
+        self._cap = value
+        if value > self.max_equity:
+            self.max_equity = value
         
-        self.current_drawdown = (self.max_equity - self.current_capital) / self.max_equity
+        self.current_drawdown = (self.max_equity - value) / self.max_equity
         
         if self.current_drawdown > self.max_drawdown:
             self.max_drawdown = self.current_drawdown
     
-    def _calculate_returns(self) -> np.ndarray:
-        """Calculate historical returns."""
-        if len(self.position_tracker.pnl_history) < 2:
-            return np.array([])
+    def _tail_risk(self) -> tuple:
+        """95% VaR and CVaR of the daily returns in the window."""
+        ordered = self._sorted_returns
+        n = len(ordered)
+        if n == 0:
+            return 0.0, 0.0
         
-        # Calculate daily returns from P&L history
-        daily_pnl = defaultdict(float)
-        for pnl_record in self.position_tracker.pnl_history:
-            date = pnl_record["exit_time"].date()
-            daily_pnl[date] += pnl_record["realized_pnl"]
+        # 5th percentile with linear interpolation (as np.percentile)
+        pos = 0.05 * (n - 1)
+        lo = int(pos)
+        hi = min(lo + 1, n - 1)
+        var_95 = ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+        
+        # Mean of the returns at or below VaR: a short prefix of the sorted window
+        tail_n = bisect_right(ordered, var_95)
+        cvar_95 = sum(islice(ordered, tail_n)) / tail_n if tail_n > 0 else 0.0
+        return var_95, cvar_95
+    
+    def _record_daily_return(self, exit_time: datetime, realized_pnl: float):
+        """Add a realized P&L to its day's slot in the daily returns ring."""
+        day = exit_time.date().toordinal()
+        if day <= self._day_head - RETURNS_LOOKBACK_DAYS:
+            return  # Older than the window
         
-        # Convert to returns
-        dates = sorted(daily_pnl.keys())
-        returns = []
-        for date in dates:
-            daily_return = daily_pnl[date] / self.initial_capital
-            returns.append(daily_return)
+        if day > self._day_head:
+            # Evict days that fall out of the window from the running moments
+            days = self._return_days
+            for slot in np.flatnonzero((days >= 0) & (days <= day - RETURNS_LOOKBACK_DAYS)):
+                self._window_remove(self._daily_returns[slot])
+                days[slot] = -1
+            self._day_head = day
         
-        return np.array(returns)
+        slot = day % RETURNS_LOOKBACK_DAYS
+        if self._return_days[slot] == day:
+            self._window_remove(self._daily_returns[slot])
+        else:
+            self._return_days[slot] = day
+            self._daily_returns[slot] = 0.0
+        self._daily_returns[slot] += realized_pnl / self.initial_capital
+        self._window_add(self._daily_returns[slot])
     
-    async def _send_alert(self, level: RiskLevel, message: str):
+    def _window_add(self, x: float):
+        """Add a daily return to the running mean / M2 and sorted window."""
+        x = float(x)
+        insort(self._sorted_returns, x)
+        self._ret_n += 1
+        delta = x - self._ret_mean
+        self._ret_mean += delta / self._ret_n
+        self._ret_m2 += delta * (x - self._ret_mean)
+    
+    def _window_remove(self, x: float):
+        """Remove a daily return from the running mean / M2 and sorted window."""
+        x = float(x)
+        del self._sorted_returns[bisect_left(self._sorted_returns, x)]
+        self._ret_n -= 1
+        if self._ret_n == 0:
+            self._ret_mean = self._ret_m2 = 0.0
+            return
+        delta = x - self._ret_mean
+        self._ret_mean -= delta / self._ret_n
+        self._ret_m2 = max(self._ret_m2 - delta * (x - self._ret_mean), 0.0)
+    
+    async def _send_alert(self, level: RiskLevel, message: str, now: Optional[datetime] = None):
         """Send risk alert."""
         alert = {
             "level": level.value,
             "message": message,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "risk_metrics": self.risk_metrics.__dict__ if self.risk_metrics else None
+            "timestamp": (now or datetime.now(timezone.utc)).isoformat(),
+            "risk_metrics": self._metrics_view if self.risk_metrics else None
         }
         
         logger.warning(f"Risk alert [{level.value}]: {message}")
         
-        # Execute alert callbacks
-        for callback in self.alert_callbacks:
-            try:
-                await callback(alert)
-            except Exception as e:
-                logger.error(f"Alert callback error: {e}")
+        # Execute alert callbacks concurrently
+        results = await asyncio.gather(
+            *(callback(alert) for callback in self.alert_callbacks), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Alert callback error: {result}")
     
     def register_alert_callback(self, callback: Callable):
         """Register alert callback."""
@@ -389,10 +571,24 @@ class RiskManager:
         """Close all positions (emergency stop)."""
         logger.critical(f"Closing all positions due to: {reason}")
         
+        # Close positions concurrently, bounded so the broker is not flooded
+        semaphore = asyncio.Semaphore(CLOSE_CONCURRENCY)
+        
+        async def close_one(symbol: str):
+            async with semaphore:
+                await self._emergency_close(symbol)
+        
+        symbols = list(self.position_tracker.positions.keys())
+        results = await asyncio.gather(*(close_one(symbol) for symbol in symbols), return_exceptions=True)
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"Emergency close failed for {symbol}: {result}")
+    
+    async def _emergency_close(self, symbol: str):
+        """Close a single position (emergency stop)."""
         # This would integrate with order execution system
         # For now, just log the action
-        for symbol in list(self.position_tracker.positions.keys()):
-            logger.info(f"Emergency close position: {symbol}")
+        logger.info(f"Emergency close position: {symbol}")
     
     async def notify_emergency(self, reason: str):
         """Notify emergency stop."""
@@ -404,8 +600,9 @@ class RiskManager:
         self.position_tracker.add_position(position)
         
         # Update daily P&L
-        today = datetime.now(timezone.utc).date()
-        self.daily_pnl[today] += position.unrealized_pnl
+        self._daily_pnl_arr[self._roll_day()] += position.unrealized_pnl
+        self.current_capital = self.initial_capital + self.position_tracker.get_total_pnl()
+        self._dirty.set()
     
     def update_position_price(self, symbol: str, price: float):
         """Update position price."""
@@ -414,8 +611,19 @@ class RiskManager:
         # Update daily P&L
         if symbol in self.position_tracker.positions:
             position = self.position_tracker.positions[symbol]
-            today = datetime.now(timezone.utc).date()
-            self.daily_pnl[today] = position.unrealized_pnl
+            self._daily_pnl_arr[self._roll_day()] = position.unrealized_pnl
+            self.current_capital = self.initial_capital + self.position_tracker.get_total_pnl()
+            self._dirty.set()
+    
+    def update_position_prices(self, prices: Dict[str, float]):
+        """Update prices for several positions in one vectorized pass."""
+        updated = self.position_tracker.update_positions(prices)
+        if updated:
+            # Same end state as updating each symbol in turn
+            position = self.position_tracker.positions[updated[-1]]
+            self._daily_pnl_arr[self._roll_day()] = position.unrealized_pnl
+            self.current_capital = self.initial_capital + self.position_tracker.get_total_pnl()
+            self._dirty.set()
     
     def close_position(self, symbol: str, exit_price: float):
         """Close position."""
@@ -426,8 +634,10 @@ class RiskManager:
             self.position_tracker.close_position(symbol, exit_price, exit_time)
             
             # Update daily P&L
-            today = exit_time.date()
-            self.daily_pnl[today] += position.realized_pnl
+            self._daily_pnl_arr[self._roll_day()] += position.realized_pnl
+            self.current_capital = self.initial_capital + self.position_tracker.get_total_pnl()
+            self._record_daily_return(exit_time, position.realized_pnl)
+            self._dirty.set()
     
     def get_risk_summary(self) -> Dict[str, Any]:
         """Get risk summary."""
@@ -474,6 +684,7 @@ class RiskManager:
     def get_positions_summary(self) -> List[Dict[str, Any]]:
         """Get positions summary."""
         positions = []
+        now = datetime.now(timezone.utc)
         for symbol, position in self.position_tracker.positions.items():
             positions.append({
                 "symbol": symbol,
@@ -483,7 +694,7 @@ class RiskManager:
                 "current_price": position.current_price,
                 "unrealized_pnl": position.unrealized_pnl,
                 "entry_time": position.entry_time.isoformat(),
-                "duration_hours": (datetime.now(timezone.utc) - position.entry_time).total_seconds() / 3600
+                "duration_hours": (now - position.entry_time).total_seconds() / 3600
             })
         return positions
 
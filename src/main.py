@@ -18,9 +18,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.config import settings
 from src.core.database import init_db, close_db
-from src.core.logging import setup_logging
+from src.core.logging import setup_logging, shutdown_logging
 from src.api.v1.api import api_router
-from src.core.security import get_current_user
+from src.core.security import get_current_user, security_manager, shutdown_bcrypt_pool
 from src.services.risk_manager import RiskManager
 from src.services.strategy_manager import StrategyManager
 from src.services.execution_service import ExecutionService
@@ -83,10 +83,15 @@ async def lifespan(app: FastAPI):
         
         # Close database
         await close_db()
+        
+        # Flush buffered audit entries and stop password hashing workers
+        await security_manager.close()
+        shutdown_bcrypt_pool()
     except Exception as e:
         logger.error("Error during shutdown", error=str(e))
     
     logger.info("Trading system shut down successfully")
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -242,5 +247,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # libuv event loop and C HTTP parser (uvloop is unavailable on Windows)
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
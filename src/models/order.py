@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OrderType(str, Enum):
@@ -33,7 +33,7 @@ class OrderStatus(str, Enum):
     EXPIRED = "expired"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order data model."""
     id: str
@@ -104,7 +104,6 @@ class OrderResponse(BaseModel):
     commission: Optional[float] = None
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -5,7 +5,7 @@ Portfolio model for the forex trading system.
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 @dataclass
@@ -74,10 +74,9 @@ class PortfolioResponse(BaseModel):
     margin_utilization: float
     created_at: datetime
     updated_at: datetime
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 @dataclass
@@ -150,5 +149,4 @@ class PortfolioMetricsResponse(BaseModel):
     kurtosis: float
     timestamp: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
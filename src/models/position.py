@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PositionSide(str, Enum):
@@ -86,7 +86,6 @@ class PositionResponse(BaseModel):
     take_profit: Optional[float] = None
     close_price: Optional[float] = None
     close_time: Optional[datetime] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
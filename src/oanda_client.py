@@ -8,7 +8,9 @@ Based on OANDA REST API v20 documentation.
 import requests
 import json
 import time
+import socket
 import asyncio
+import orjson
 import websockets
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
@@ -16,6 +18,15 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Streaming connection tuning: frequent pings detect dead links quickly and a
+# small receive queue keeps the consumer on the freshest prices.
+STREAM_PING_INTERVAL = 15
+STREAM_PING_TIMEOUT = 20
+STREAM_MAX_QUEUE = 64
+# 1 MiB read/write high-water marks per stream: spends memory to absorb
+# bursts (e.g. London/NY open) without stalling on drain.
+STREAM_BUFFER_LIMIT = 2 ** 20
+
 class OANDAClient:
     """Comprehensive OANDA API client."""
     
@@ -360,6 +371,25 @@ class OANDAClient:
         return self.create_order(order_data)
 
     # Streaming API (WebSocket)
+    def _stream_connect(self, uri: str):
+        """Open a tuned WebSocket connection to the OANDA streaming API."""
+        return websockets.connect(
+            uri,
+            extra_headers={"Authorization": f"Bearer {self.api_key}"},
+            ping_interval=STREAM_PING_INTERVAL,
+            ping_timeout=STREAM_PING_TIMEOUT,
+            max_queue=STREAM_MAX_QUEUE,
+            read_limit=STREAM_BUFFER_LIMIT,
+            write_limit=STREAM_BUFFER_LIMIT
+        )
+
+    @staticmethod
+    def _set_nodelay(websocket):
+        """Disable Nagle's algorithm so small frames are not delayed."""
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     async def stream_pricing(self, instruments: List[str], callback):
         """Stream real-time pricing data."""
         uri = f"{self.stream_url}/v3/accounts/{self.account_id}/pricing/stream"
@@ -369,13 +399,14 @@ class OANDAClient:
         uri += f"?instruments={instruments_str}"
         
         try:
-            async with websockets.connect(uri, extra_headers={"Authorization": f"Bearer {self.api_key}"}) as websocket:
+            async with self._stream_connect(uri) as websocket:
+                self._set_nodelay(websocket)
                 logger.info("Connected to OANDA pricing stream", instruments=instruments)
                 
                 while True:
                     try:
                         message = await websocket.recv()
-                        data = json.loads(message)
+                        data = orjson.loads(message)
                         
                         if "type" in data and data["type"] == "PRICE":
                             await callback(data)
@@ -398,13 +429,14 @@ class OANDAClient:
         uri = f"{self.stream_url}/v3/accounts/{self.account_id}/transactions/stream"
         
         try:
-            async with websockets.connect(uri, extra_headers={"Authorization": f"Bearer {self.api_key}"}) as websocket:
+            async with self._stream_connect(uri) as websocket:
+                self._set_nodelay(websocket)
                 logger.info("Connected to OANDA transaction stream")
                 
                 while True:
                     try:
                         message = await websocket.recv()
-                        data = json.loads(message)
+                        data = orjson.loads(message)
                         
                         if "type" in data and data["type"] == "TRANSACTION":
                             await callback(data)
@@ -0,0 +1,38 @@
+"""
+Trader Fast Path
+Per-tick P&L and exit-condition checks for the autonomous trader.
+
+Kept fully typed and free of dynamic features so it can be compiled with
+mypyc (`make build-fastpath`); the pure-Python module is used otherwise.
+"""
+
+UNITS_PER_LOT: float = 100000.0
+
+EXIT_NONE: str = ""
+EXIT_STOP_LOSS: str = "Stop Loss"
+EXIT_TAKE_PROFIT: str = "Take Profit"
+
+
+def side_sign(side: str) -> int:
+    """Return +1 for a BUY and -1 for a SELL."""
+    return 1 if side == "BUY" else -1
+
+
+def trade_pnl(sign: int, entry_price: float, price: float, lot_size: float) -> float:
+    """P&L of a position at `price` given its side sign."""
+    return sign * (price - entry_price) * lot_size * UNITS_PER_LOT
+
+
+def check_exit(sign: int, price: float, stop_loss: float, take_profit: float) -> str:
+    """Return the exit reason hit at `price`, or an empty string."""
+    if sign > 0:
+        if price <= stop_loss:
+            return EXIT_STOP_LOSS
+        if price >= take_profit:
+            return EXIT_TAKE_PROFIT
+    else:
+        if price >= stop_loss:
+            return EXIT_STOP_LOSS
+        if price <= take_profit:
+            return EXIT_TAKE_PROFIT
+    return EXIT_NONE
@@ -0,0 +1,8 @@
+"""
+Shared pytest configuration: make the `src` package importable when running `pytest tests/`.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
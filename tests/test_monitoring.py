@@ -0,0 +1,66 @@
+"""
+Unit tests for src.live.monitoring.
+"""
+
+import operator
+import random
+from collections import deque
+from datetime import datetime, timezone
+
+import pytest
+
+from src.live.monitoring import DABA, HealthCheck, HealthStatus
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 3, 7, 64])
+@pytest.mark.parametrize("seed", range(5))
+def test_daba_matches_deque_window(capacity, seed):
+    rng = random.Random(seed)
+    total = DABA(operator.add, 0, capacity)
+    low = DABA(min, float("inf"), capacity)
+    high = DABA(max, float("-inf"), capacity)
+    window = deque()
+
+    for _ in range(2000):
+        # Mostly fill up to capacity, with runs of evictions down to empty
+        if window and (len(window) == capacity or rng.random() < 0.4):
+            window.popleft()
+            for agg in (total, low, high):
+                agg.evict()
+        else:
+            value = rng.randint(-1000, 1000)
+            window.append(value)
+            for agg in (total, low, high):
+                agg.insert(value)
+
+        assert len(total) == len(low) == len(high) == len(window)
+        assert total.query() == sum(window)
+        assert low.query() == min(window, default=float("inf"))
+        assert high.query() == max(window, default=float("-inf"))
+
+
+def test_daba_sliding_window_at_capacity():
+    capacity = 5
+    high = DABA(max, float("-inf"), capacity)
+    values = [3, 9, 1, 4, 2, 8, 0, 0, 0, 0, 0, 7]
+    window = deque()
+
+    for value in values:
+        if len(window) == capacity:
+            window.popleft()
+            high.evict()
+        window.append(value)
+        high.insert(value)
+        assert high.query() == max(window)
+
+
+def test_health_check_caches_iso_timestamp():
+    ts = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    check = HealthCheck("redis", HealthStatus.HEALTHY, "ok", 0.01, ts)
+    later = HealthCheck("redis", HealthStatus.HEALTHY, "ok", 0.01, ts)
+
+    assert check._timestamp_iso == ts.isoformat()
+    assert "_timestamp_iso" not in repr(check)
+    assert check == later
+    with pytest.raises(TypeError):
+        HealthCheck("redis", HealthStatus.HEALTHY, "ok", 0.01, ts, {}, "stale")
@@ -0,0 +1,207 @@
+"""
+Unit tests for src.ingest.realtime.
+"""
+
+import orjson
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from src.ingest.realtime import (
+    CACHE_COMPRESS_THRESHOLD,
+    _CACHE_PLAIN,
+    _CACHE_ZSTD,
+    DataCache,
+    DataSource,
+    RealTimeDataIngestion,
+)
+
+
+@pytest_asyncio.fixture
+async def quote_server():
+    """Local HTTP server answering GET /quote with a fixed payload."""
+    async def quote(request):
+        return web.json_response({"symbol": request.query.get("symbol"), "close": 1.2345})
+
+    app = web.Application()
+    app.router.add_get("/quote", quote)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    yield f"http://{host}:{port}/quote"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_fetch_without_initialize_creates_session(quote_server):
+    ingestion = RealTimeDataIngestion()
+    assert ingestion._session is None
+
+    data = await ingestion.fetch_data_with_resilience(DataSource.POLYGON, quote_server, params={"symbol": "EURUSD"})
+
+    assert data == {"symbol": "EURUSD", "close": 1.2345}
+    assert ingestion._session is not None and not ingestion._session.closed
+    await ingestion.stop_all_streams()
+    assert ingestion._session is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_reopens_closed_session(quote_server):
+    ingestion = RealTimeDataIngestion()
+    await ingestion.fetch_data_with_resilience(DataSource.POLYGON, quote_server, params={"symbol": "EURUSD"})
+    await ingestion._session.close()
+
+    data = await ingestion.fetch_data_with_resilience(DataSource.POLYGON, quote_server, params={"symbol": "GBPUSD"})
+
+    assert data == {"symbol": "GBPUSD", "close": 1.2345}
+    await ingestion.stop_all_streams()
+
+
+
+@pytest_asyncio.fixture
+async def flaky_server():
+    """Local HTTP server whose /quote fails with 503 for the first `failures` requests."""
+    state = {"attempts": 0, "failures": 2, "status": 503}
+
+    async def quote(request):
+        state["attempts"] += 1
+        if state["attempts"] <= state["failures"]:
+            return web.Response(status=state["status"])
+        return web.json_response({"close": 1.2345})
+
+    app = web.Application()
+    app.router.add_get("/quote", quote)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    yield f"http://{host}:{port}/quote", state
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_retry_retries_upstream_errors(flaky_server):
+    url, state = flaky_server
+    ingestion = RealTimeDataIngestion()
+
+    data = await ingestion.fetch_with_retry(DataSource.POLYGON, url, base_delay=0.01)
+
+    assert data == {"close": 1.2345}
+    assert state["attempts"] == 3
+    await ingestion.stop_all_streams()
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_retry_gives_up_after_max_tries(flaky_server):
+    url, state = flaky_server
+    state["failures"] = 10
+    ingestion = RealTimeDataIngestion()
+
+    assert await ingestion.fetch_with_retry(DataSource.POLYGON, url, max_tries=3, base_delay=0.01) is None
+    assert state["attempts"] == 3
+    await ingestion.stop_all_streams()
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_retry_does_not_retry_client_errors(flaky_server):
+    url, state = flaky_server
+    state["status"] = 404
+    ingestion = RealTimeDataIngestion()
+
+    assert await ingestion.fetch_with_retry(DataSource.POLYGON, url, base_delay=0.01) is None
+    assert state["attempts"] == 1
+    await ingestion.stop_all_streams()
+
+@pytest.mark.asyncio
+async def test_malformed_tick_is_still_delivered_to_handler():
+    ingestion = RealTimeDataIngestion()
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    ingestion.register_data_handler(DataSource.POLYGON, handler)
+    await ingestion.start_websocket_stream(DataSource.POLYGON, "ws://127.0.0.1:9/")
+    on_message = ingestion.websocket_managers[DataSource.POLYGON].on_message
+
+    tick = {"symbol": "EURUSD", "close": "not-a-number"}
+    await on_message(tick)
+
+    assert received == [tick]
+    assert (DataSource.POLYGON, "EURUSD") in ingestion.latest
+    await ingestion.stop_all_streams()
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("symbol, key", [(None, "None"), (12345, "12345")])
+async def test_non_string_symbol_is_delivered_and_recorded(symbol, key):
+    ingestion = RealTimeDataIngestion()
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    ingestion.register_data_handler(DataSource.POLYGON, handler)
+    await ingestion.start_websocket_stream(DataSource.POLYGON, "ws://127.0.0.1:9/")
+    on_message = ingestion.websocket_managers[DataSource.POLYGON].on_message
+
+    tick = {"symbol": symbol, "close": 1.1}
+    await on_message(tick)
+
+    assert received == [tick]
+    assert (DataSource.POLYGON, key) in ingestion.latest
+    await ingestion.stop_all_streams()
+
+def test_system_health_returns_breaker_snapshot_copy():
+    ingestion = RealTimeDataIngestion()
+    health = ingestion.get_system_health()
+
+    health["circuit_breakers"]["oanda"] = "OPEN"
+
+    assert ingestion.get_system_health()["circuit_breakers"]["oanda"] == "CLOSED"
+
+
+def test_small_payload_is_stored_plain():
+    cache = DataCache()
+    raw = orjson.dumps({"symbol": "EURUSD", "close": 1.1})
+    assert len(raw) <= CACHE_COMPRESS_THRESHOLD
+
+    stored = cache._pack(raw)
+
+    assert stored == _CACHE_PLAIN + raw
+    assert cache._unpack(stored) == raw
+
+
+def test_payload_at_threshold_is_stored_plain():
+    cache = DataCache()
+    raw = b"x" * CACHE_COMPRESS_THRESHOLD
+
+    stored = cache._pack(raw)
+
+    assert stored[:1] == _CACHE_PLAIN
+    assert cache._unpack(stored) == raw
+
+
+def test_large_payload_is_compressed():
+    cache = DataCache()
+    raw = orjson.dumps({"bars": [{"t": i, "close": 1.1 + i / 1e4} for i in range(200)]})
+    assert len(raw) > CACHE_COMPRESS_THRESHOLD
+
+    stored = cache._pack(raw)
+
+    assert stored[:1] == _CACHE_ZSTD
+    assert len(stored) < len(raw)
+    assert cache._unpack(stored) == raw
+    assert orjson.loads(cache._unpack(stored)) == orjson.loads(raw)
+
+
+def test_untagged_legacy_value_is_returned_unchanged():
+    cache = DataCache()
+    legacy = orjson.dumps({"symbol": "EURUSD", "close": 1.1})
+
+    assert cache._unpack(legacy) == legacy
+    assert orjson.loads(cache._unpack(legacy)) == {"symbol": "EURUSD", "close": 1.1}
@@ -0,0 +1,258 @@
+"""
+Property tests for src.live.risk_manager.
+
+The incremental state (running P&L / exposure sums, column slots, the daily
+returns ring, Welford moments and the sorted VaR window) is checked against
+a brute-force recomputation after every operation.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.live.risk_manager import (
+    RETURNS_LOOKBACK_DAYS,
+    Position,
+    PositionSide,
+    PositionTracker,
+    RiskManager,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_position(rng, symbol):
+    return Position(
+        symbol=symbol,
+        side=rng.choice([PositionSide.LONG, PositionSide.SHORT]),
+        size=rng.uniform(0.1, 1000.0),
+        entry_price=rng.uniform(0.5, 200.0),
+        current_price=rng.uniform(0.5, 200.0),
+        entry_time=START,
+        realized_pnl=rng.choice([0.0, rng.uniform(-50.0, 50.0)]),
+    )
+
+
+def expected_unrealized(position, price=None):
+    price = position.current_price if price is None else price
+    sign = 1.0 if position.side == PositionSide.LONG else -1.0
+    return sign * (price - position.entry_price) * position.size
+
+
+def check_tracker(tracker, added):
+    """Compare the tracker's incremental state with a brute-force recomputation."""
+    positions = tracker.positions
+    unrealized = sum(expected_unrealized(p) for p in positions.values())
+    exposure = sum(abs(p.size * p.current_price) for p in positions.values())
+    realized = sum(p.realized_pnl for p in added)
+
+    assert tracker.get_unrealized_pnl() == pytest.approx(unrealized, rel=1e-9, abs=1e-6)
+    assert tracker.get_total_exposure() == pytest.approx(exposure, rel=1e-9, abs=1e-6)
+    assert tracker.get_realized_pnl() == pytest.approx(realized, rel=1e-9, abs=1e-6)
+    assert tracker.get_total_pnl() == pytest.approx(realized + unrealized, rel=1e-9, abs=1e-6)
+    for position in positions.values():
+        assert position.unrealized_pnl == pytest.approx(expected_unrealized(position), rel=1e-9, abs=1e-9)
+
+    # Every slot is either owned by exactly one open position or free
+    slots = tracker._slots
+    assert set(slots) == set(positions)
+    assert len(set(slots.values())) == len(slots)
+    assert sorted(list(slots.values()) + tracker._free_slots) == list(range(tracker._capacity))
+    for column in (tracker._sides, tracker._sizes, tracker._entry_prices, tracker._current_prices):
+        assert len(column) == tracker._capacity
+    for symbol, slot in slots.items():
+        position = positions[symbol]
+        assert tracker._sides[slot] == position.sign
+        assert tracker._sizes[slot] == position.size
+        assert tracker._entry_prices[slot] == position.entry_price
+        assert tracker._current_prices[slot] == position.current_price
+    for slot in tracker._free_slots:
+        assert tracker._sizes[slot] == 0.0
+
+    # recompute_totals rebuilds the same sums from the columns
+    tracker.recompute_totals()
+    assert tracker.get_unrealized_pnl() == pytest.approx(unrealized, rel=1e-9, abs=1e-6)
+    assert tracker.get_total_exposure() == pytest.approx(exposure, rel=1e-9, abs=1e-6)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tracker_matches_brute_force(seed):
+    rng = random.Random(seed)
+    tracker = PositionTracker()
+    symbols = [f"SYM{i}" for i in range(150)]  # More than the initial 64 slots
+    added = []
+    closed = 0
+
+    for step in range(1500):
+        op = rng.random()
+        open_symbols = list(tracker.positions)
+        if op < 0.35 or not open_symbols:
+            # Add a new position, or replace an open one
+            position = make_position(rng, rng.choice(symbols))
+            tracker.add_position(position)
+            added.append(position)
+        elif op < 0.6:
+            tracker.update_position(rng.choice(open_symbols), rng.uniform(0.5, 200.0))
+        elif op < 0.8:
+            prices = {symbol: rng.uniform(0.5, 200.0) for symbol in rng.sample(open_symbols, min(len(open_symbols), 20))}
+            prices["UNKNOWN"] = 1.0
+            updated = tracker.update_positions(prices)
+            assert sorted(updated) == sorted(set(prices) - {"UNKNOWN"})
+        else:
+            symbol = rng.choice(open_symbols)
+            position = tracker.positions[symbol]
+            exit_price = rng.uniform(0.5, 200.0)
+            tracker.close_position(symbol, exit_price, START + timedelta(hours=step))
+            closed += 1
+            assert position.realized_pnl == pytest.approx(expected_unrealized(position, exit_price))
+            assert tracker.pnl_history[-1]["realized_pnl"] == position.realized_pnl
+
+        check_tracker(tracker, added)
+
+    assert tracker._capacity > 64
+    assert len(tracker.pnl_history) == closed
+
+
+def test_replacing_position_reuses_its_slot():
+    rng = random.Random(0)
+    tracker = PositionTracker()
+    first = make_position(rng, "EURUSD")
+    tracker.add_position(first)
+    slot = tracker._slots["EURUSD"]
+    free = list(tracker._free_slots)
+
+    second = make_position(rng, "EURUSD")
+    tracker.add_position(second)
+
+    assert tracker._slots["EURUSD"] == slot
+    assert tracker._free_slots == free
+    check_tracker(tracker, [first, second])
+
+
+def test_batch_price_update_matches_sequential_updates():
+    rng = random.Random(1)
+    batched = RiskManager()
+    sequential = RiskManager()
+    for i in range(30):
+        position = make_position(rng, f"SYM{i}")
+        for manager in (batched, sequential):
+            manager.add_position(Position(
+                symbol=position.symbol, side=position.side, size=position.size,
+                entry_price=position.entry_price, current_price=position.current_price,
+                entry_time=position.entry_time,
+            ))
+
+    prices = {f"SYM{i}": rng.uniform(0.5, 200.0) for i in rng.sample(range(30), 12)}
+    batched.update_position_prices(prices)
+    for symbol, price in prices.items():
+        sequential.update_position_price(symbol, price)
+
+    assert batched.current_capital == pytest.approx(sequential.current_capital)
+    assert batched.current_drawdown == pytest.approx(sequential.current_drawdown)
+    assert batched._daily_pnl_arr[batched._today_idx] == pytest.approx(sequential._daily_pnl_arr[sequential._today_idx])
+    for symbol, position in batched.position_tracker.positions.items():
+        other = sequential.position_tracker.positions[symbol]
+        assert position.current_price == other.current_price
+        assert position.unrealized_pnl == pytest.approx(other.unrealized_pnl)
+
+
+class ReturnsOracle:
+    """Daily returns window recomputed from scratch."""
+
+    def __init__(self, initial_capital):
+        self.initial_capital = initial_capital
+        self.returns = {}
+        self.head = None
+
+    def record(self, day, pnl):
+        if self.head is not None and day <= self.head - RETURNS_LOOKBACK_DAYS:
+            return
+        self.returns[day] = self.returns.get(day, 0.0) + pnl / self.initial_capital
+        self.head = day if self.head is None else max(self.head, day)
+        for old in [d for d in self.returns if d <= self.head - RETURNS_LOOKBACK_DAYS]:
+            del self.returns[old]
+
+    def values(self):
+        return np.array([self.returns[day] for day in sorted(self.returns)])
+
+
+def check_returns(manager, oracle):
+    values = oracle.values()
+    n = len(values)
+
+    assert manager._ret_n == n
+    assert manager._sorted_returns == pytest.approx(sorted(values.tolist()), abs=1e-15)
+    for day, value in oracle.returns.items():
+        slot = day % RETURNS_LOOKBACK_DAYS
+        assert manager._return_days[slot] == day
+        assert manager._daily_returns[slot] == pytest.approx(value, abs=1e-15)
+    assert int((manager._return_days >= 0).sum()) == n
+
+    if n == 0:
+        assert manager._tail_risk() == (0.0, 0.0)
+        return
+
+    assert manager._ret_mean == pytest.approx(values.mean(), rel=1e-9, abs=1e-12)
+    assert np.sqrt(manager._ret_m2 / n) == pytest.approx(np.std(values), rel=1e-6, abs=1e-9)
+
+    var_95, cvar_95 = manager._tail_risk()
+    assert var_95 == pytest.approx(np.percentile(values, 5), rel=1e-9, abs=1e-12)
+    tail = values[values <= var_95]
+    assert cvar_95 == pytest.approx(tail.mean(), rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_daily_returns_window_matches_brute_force(seed):
+    rng = random.Random(seed)
+    manager = RiskManager()
+    oracle = ReturnsOracle(manager.initial_capital)
+    day = 0
+
+    for _ in range(1500):
+        op = rng.random()
+        if op < 0.4:
+            day += rng.choice([1, 1, 1, 2, 3, 7])  # Next trading day(s)
+        elif op < 0.45:
+            day += rng.randint(RETURNS_LOOKBACK_DAYS // 2, 2 * RETURNS_LOOKBACK_DAYS)  # Long gap
+        # Otherwise same day
+
+        target = day
+        back = rng.random()
+        if back < 0.15:
+            target = day - rng.randint(1, RETURNS_LOOKBACK_DAYS - 1)  # Late fill still in the window
+        elif back < 0.2:
+            target = day - rng.randint(RETURNS_LOOKBACK_DAYS, 3 * RETURNS_LOOKBACK_DAYS)  # Out of window
+
+        pnl = rng.uniform(-2000.0, 2000.0)
+        manager._record_daily_return(START + timedelta(days=target, hours=rng.randint(0, 23)), pnl)
+        oracle.record((START + timedelta(days=target)).date().toordinal(), pnl)
+        check_returns(manager, oracle)
+
+    assert len(oracle.returns) > 1
+
+
+@pytest.mark.asyncio
+async def test_risk_metrics_match_numpy():
+    rng = random.Random(7)
+    manager = RiskManager()
+    oracle = ReturnsOracle(manager.initial_capital)
+    for i in range(400):
+        exit_time = START + timedelta(days=i)
+        pnl = rng.gauss(50.0, 900.0)
+        manager._record_daily_return(exit_time, pnl)
+        oracle.record(exit_time.date().toordinal(), pnl)
+    # Metrics need at least two closed trades
+    manager.position_tracker.pnl_history.extend([{}, {}])
+
+    await manager.update_risk_metrics(START)
+
+    values = oracle.values()
+    assert len(values) == RETURNS_LOOKBACK_DAYS
+    metrics = manager.risk_metrics
+    std = np.std(values)
+    assert metrics.volatility == pytest.approx(std * np.sqrt(252), rel=1e-6)
+    assert metrics.sharpe_ratio == pytest.approx((values.mean() - 0.02 / 252) / std, rel=1e-6)
+    assert metrics.var_95 == pytest.approx(np.percentile(values, 5), rel=1e-9)
+    assert metrics.cvar_95 == pytest.approx(values[values <= metrics.var_95].mean(), rel=1e-9)
@@ -0,0 +1,184 @@
+"""
+Unit tests for src.core.security.
+"""
+
+import base64
+import time
+from datetime import timedelta
+
+import orjson
+import pytest
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError
+
+from src.core.security import SecurityManager, _ALGORITHM, _SECRET_KEY
+
+
+class FakePipeline:
+    """Records pipeline commands; execute() applies them to the fake Redis."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def lpush(self, key, *values):
+        self.commands.append(("lpush", key, list(values)))
+
+    def ltrim(self, key, start, end):
+        self.commands.append(("ltrim", key, start, end))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis unavailable")
+        for command in self.commands:
+            if command[0] == "lpush":
+                for value in command[2]:
+                    self.redis.lists.setdefault(command[1], []).insert(0, value)
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the audit log."""
+
+    def __init__(self):
+        self.lists = {}
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def manager():
+    manager = SecurityManager()
+    manager.redis_client = FakeRedis()
+    return manager
+
+
+def audit_actions(redis):
+    """Audit actions stored in Redis, oldest first."""
+    return [orjson.loads(value)["action"] for value in reversed(redis.lists.get("audit_log", []))]
+
+
+@pytest.mark.asyncio
+async def test_flush_pushes_all_entries_in_order(manager):
+    for i in range(300):
+        manager._audit_buffer.append({"action": f"a{i}"})
+
+    await manager.flush_audit_log()
+
+    assert not manager._audit_buffer
+    assert audit_actions(manager.redis_client) == [f"a{i}" for i in range(300)]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_entries_for_retry(manager):
+    for i in range(5):
+        manager._audit_buffer.append({"action": f"a{i}"})
+    manager.redis_client.fail = True
+
+    with pytest.raises(ConnectionError):
+        await manager.flush_audit_log()
+    assert [entry["action"] for entry in manager._audit_buffer] == [f"a{i}" for i in range(5)]
+
+    manager.redis_client.fail = False
+    await manager.flush_audit_log()
+    assert audit_actions(manager.redis_client) == [f"a{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_close_stops_flusher_and_flushes_buffer(manager):
+    await manager.create_audit_log("user", "login", {})
+    await manager.create_audit_log("user", "logout", {})
+    task = manager._audit_flush_task
+
+    await manager.close()
+
+    assert task.done()
+    assert manager._audit_flush_task is None
+    assert not manager._audit_buffer
+    assert audit_actions(manager.redis_client) == ["login", "logout"]
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_entries_when_redis_is_down(manager):
+    await manager.create_audit_log("user", "login", {})
+    manager.redis_client.fail = True
+
+    await manager.close()
+
+    assert [entry["action"] for entry in manager._audit_buffer] == ["login"]
+
+
+def test_access_token_decodes_with_jose(manager):
+    token = manager.create_access_token({"sub": "alice", "role": "trader"})
+
+    payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+
+    assert payload["sub"] == "alice"
+    assert payload["role"] == "trader"
+
+
+def test_access_token_matches_jose_encoding(manager):
+    token = manager.create_access_token({"sub": "alice"})
+    payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+
+    assert token == jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM)
+
+
+def test_verify_token_round_trip(manager):
+    token = manager.create_access_token({"sub": "alice"})
+
+    payload = manager.verify_token(token)
+
+    assert payload is not None
+    assert payload["sub"] == "alice"
+    # Second call is served from the cache
+    assert manager.verify_token(token) == payload
+
+
+def test_tampered_signature_is_rejected(manager):
+    token = manager.create_access_token({"sub": "alice"})
+    header, body, signature = token.split(".")
+    tampered_signature = ("A" if signature[0] != "A" else "B") + signature[1:]
+
+    assert manager.verify_token(f"{header}.{body}.{tampered_signature}") is None
+
+
+def test_tampered_payload_is_rejected(manager):
+    token = manager.create_access_token({"sub": "alice"})
+    header, _, signature = token.split(".")
+    forged_body = base64.urlsafe_b64encode(b'{"sub":"mallory","exp":9999999999}').rstrip(b"=").decode()
+
+    assert manager.verify_token(f"{header}.{forged_body}.{signature}") is None
+
+
+def test_token_signed_with_other_key_is_rejected(manager):
+    token = jwt.encode({"sub": "alice", "exp": int(time.time()) + 60}, "not-the-secret", algorithm=_ALGORITHM)
+
+    assert manager.verify_token(token) is None
+
+
+def test_exp_claim_is_set_from_expires_delta(manager):
+    before = int(time.time())
+    token = manager.create_access_token({"sub": "alice"}, expires_delta=timedelta(minutes=5))
+    payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+
+    assert before + 300 <= payload["exp"] <= int(time.time()) + 300
+
+
+def test_expired_token_is_rejected(manager):
+    token = manager.create_access_token({"sub": "alice"}, expires_delta=timedelta(seconds=-10))
+
+    with pytest.raises(ExpiredSignatureError):
+        jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+    assert manager.verify_token(token) is None
+
+
+def test_cached_token_is_rejected_after_expiry(manager):
+    token = manager.create_access_token({"sub": "alice"}, expires_delta=timedelta(seconds=1))
+    assert manager.verify_token(token) is not None
+
+    time.sleep(2.1)
+
+    assert manager.verify_token(token) is None
+    assert token not in manager._token_cache